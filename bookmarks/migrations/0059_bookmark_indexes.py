@@ -0,0 +1,52 @@
+# Generated by Django 5.2.4 on 2026-10-14 04:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookmarks", "0058_userprofile_default_mark_shared"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="bookmark",
+            name="url_normalized",
+            field=models.CharField(blank=True, max_length=2048),
+        ),
+        migrations.AddIndex(
+            model_name="bookmark",
+            index=models.Index(
+                fields=["owner", "url_normalized"], name="bm_owner_urln_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bookmark",
+            index=models.Index(
+                condition=models.Q(("url_normalized", "")),
+                fields=["owner", "url"],
+                name="bm_owner_url_fb_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bookmark",
+            index=models.Index(
+                fields=["owner", "-date_added"], name="bm_owner_dadd_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bookmark",
+            index=models.Index(
+                fields=["owner", "-date_modified"], name="bm_owner_dmod_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bookmark",
+            index=models.Index(
+                fields=["owner", "is_archived", "is_deleted"], name="bm_owner_flags_idx"
+            ),
+        ),
+    ]
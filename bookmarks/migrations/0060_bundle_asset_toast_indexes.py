@@ -0,0 +1,39 @@
+# Generated by Django 5.2.4 on 2026-10-14 05:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookmarks", "0059_bookmark_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="bookmarkbundle",
+            options={"ordering": ["order"]},
+        ),
+        migrations.AddIndex(
+            model_name="bookmarkasset",
+            index=models.Index(
+                fields=["bookmark", "-date_created"], name="basset_bm_dcr_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bookmarkasset",
+            index=models.Index(fields=["bookmark", "status"], name="basset_bm_st_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="bookmarkbundle",
+            index=models.Index(fields=["owner", "order"], name="bbun_own_ord_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="toast",
+            index=models.Index(
+                fields=["owner", "acknowledged"], name="toast_own_ack_idx"
+            ),
+        ),
+    ]
@@ -1,11 +1,15 @@
 import hashlib
 import logging
+import operator
 import os
 import re
+import stat
+import sys
 import calendar
-from functools import cached_property
+import copy
+from functools import cached_property, lru_cache
 from typing import List
-from datetime import date, timedelta, datetime
+from datetime import date, timedelta
 
 
 import binascii
@@ -19,7 +23,7 @@ from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.http import QueryDict
 
-from bookmarks.utils import unique, normalize_url
+from bookmarks.utils import normalize_url
 from bookmarks.validators import BookmarkURLValidator
 
 logger = logging.getLogger(__name__)
@@ -30,27 +34,51 @@ class Tag(models.Model):
     date_added = models.DateTimeField()
     owner = models.ForeignKey(User, on_delete=models.CASCADE)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # tag names are short and repeat a lot across bookmarks, intern them
+        # to share the strings and speed up comparisons and hashing
+        name = instance.__dict__.get("name")
+        if name:
+            instance.name = sys.intern(name)
+        return instance
+
     def __str__(self):
         return self.name
 
 
+_TAG_NAME_TRANSLATION = str.maketrans({" ": "-", "\t": "-", "\xa0": "-"})
+
+
 def sanitize_tag_name(tag_name: str):
     # strip leading/trailing spaces
-    # replace inner spaces with replacement char
-    return tag_name.strip().replace(" ", "-")
+    # replace inner spaces (including tabs and non-breaking spaces) with
+    # replacement char
+    return tag_name.strip().translate(_TAG_NAME_TRANSLATION)
 
 
 def parse_tag_string(tag_string: str, delimiter: str = ","):
     if not tag_string:
         return []
-    names = tag_string.strip().split(delimiter)
-    # remove empty names, sanitize remaining names
-    names = [sanitize_tag_name(name) for name in names if name.strip()]
-    # remove duplicates
-    names = unique(names, str.lower)
-    names.sort(key=str.lower)
-
-    return names
+    # sanitize names, skip empty ones and remove duplicates (case-insensitive)
+    # while collecting (lowercase, name) pairs, so that lower() is only
+    # computed once per name
+    seen = set()
+    names = []
+    for name in tag_string.split(delimiter):
+        name = sanitize_tag_name(name)
+        if not name:
+            continue
+        key = name.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        names.append((key, name))
+    # keys are unique, so sorting the pairs only compares the lowercase names
+    names.sort()
+
+    return [name for _, name in names]
 
 
 def build_tag_string(tag_names: List[str], delimiter: str = ","):
@@ -59,7 +87,7 @@ def build_tag_string(tag_names: List[str], delimiter: str = ","):
 
 class Bookmark(models.Model):
     url = models.CharField(max_length=2048, validators=[BookmarkURLValidator()])
-    url_normalized = models.CharField(max_length=2048, blank=True, db_index=True)
+    url_normalized = models.CharField(max_length=2048, blank=True)
     title = models.CharField(max_length=512, blank=True)
     description = models.TextField(blank=True)
     notes = models.TextField(blank=True)
@@ -89,6 +117,24 @@ class Bookmark(models.Model):
         related_name="latest_snapshot",
     )
 
+    class Meta:
+        indexes = [
+            # query_existing lookup, and its fallback to the exact URL
+            models.Index(fields=["owner", "url_normalized"], name="bm_owner_urln_idx"),
+            models.Index(
+                fields=["owner", "url"],
+                condition=Q(url_normalized=""),
+                name="bm_owner_url_fb_idx",
+            ),
+            # default sort orders and archived / trashed filters
+            models.Index(fields=["owner", "-date_added"], name="bm_owner_dadd_idx"),
+            models.Index(fields=["owner", "-date_modified"], name="bm_owner_dmod_idx"),
+            models.Index(
+                fields=["owner", "is_archived", "is_deleted"],
+                name="bm_owner_flags_idx",
+            ),
+        ]
+
     @property
     def resolved_title(self):
         if self.title:
@@ -102,12 +148,36 @@ class Bookmark(models.Model):
 
     @property
     def tag_names(self):
-        names = [tag.name for tag in self.tags.all()]
-        return sorted(names)
+        # use prefetched tags if available, otherwise only load the names.
+        # Names are always sorted in Python, so the order does not depend on
+        # the collation of the database. The result is not cached on the
+        # instance, tags can change through the reverse relation or bulk
+        # updates of the through table without notifying this instance.
+        if "tags" in getattr(self, "_prefetched_objects_cache", {}):
+            return sorted(tag.name for tag in self.tags.all())
+        names = self.tags.values_list("name", flat=True)
+        return sorted(sys.intern(name) for name in names)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # remember the loaded URL, so that save can skip normalizing it again
+        # if it did not change
+        instance._loaded_url = instance.__dict__.get("url")
+        return instance
 
     def save(self, *args, **kwargs):
-        self.url_normalized = normalize_url(self.url)
+        update_fields = kwargs.get("update_fields")
+        url_fields_updated = update_fields is None or (
+            "url" in update_fields or "url_normalized" in update_fields
+        )
+        if url_fields_updated and (
+            getattr(self, "_loaded_url", None) != self.url or not self.url_normalized
+        ):
+            self.url_normalized = normalize_url(self.url)
         super().save(*args, **kwargs)
+        if url_fields_updated:
+            self._loaded_url = self.url
 
     def __str__(self):
         return self.resolved_title + " (" + self.url[:30] + "...)"
@@ -127,13 +197,12 @@ class Bookmark(models.Model):
 def bookmark_deleted(sender, instance, **kwargs):
     if instance.preview_image_file:
         filepath = os.path.join(settings.LD_PREVIEW_FOLDER, instance.preview_image_file)
-        if os.path.isfile(filepath):
-            try:
-                os.remove(filepath)
-            except Exception as error:
-                logger.error(
-                    f"Failed to delete preview image: {filepath}", exc_info=error
-                )
+        try:
+            os.remove(filepath)
+        except FileNotFoundError:
+            pass
+        except Exception as error:
+            logger.error(f"Failed to delete preview image: {filepath}", exc_info=error)
 
 
 class BookmarkAsset(models.Model):
@@ -156,6 +225,12 @@ class BookmarkAsset(models.Model):
     status = models.CharField(max_length=64, blank=False, null=False)
     gzip = models.BooleanField(default=False, null=False)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["bookmark", "-date_created"], name="basset_bm_dcr_idx"),
+            models.Index(fields=["bookmark", "status"], name="basset_bm_st_idx"),
+        ]
+
     @property
     def download_name(self):
         return (
@@ -164,15 +239,35 @@ class BookmarkAsset(models.Model):
             else self.display_name
         )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # remember the loaded file, so that save can skip reading the file
+        # size again if it did not change
+        instance._loaded_file = instance.__dict__.get("file")
+        return instance
+
     def save(self, *args, **kwargs):
-        if self.file:
+        update_fields = kwargs.get("update_fields")
+        file_updated = update_fields is None or "file" in update_fields
+        if (
+            self.file
+            and file_updated
+            and (
+                getattr(self, "_loaded_file", None) != self.file
+                or self.file_size is None
+            )
+        ):
             try:
                 file_path = os.path.join(settings.LD_ASSET_FOLDER, self.file)
-                if os.path.isfile(file_path):
-                    self.file_size = os.path.getsize(file_path)
+                file_stat = os.stat(file_path)
+                if stat.S_ISREG(file_stat.st_mode):
+                    self.file_size = file_stat.st_size
             except Exception:
                 pass
         super().save(*args, **kwargs)
+        if file_updated:
+            self._loaded_file = self.file
 
     def __str__(self):
         return self.display_name or f"Bookmark Asset #{self.pk}"
@@ -182,11 +277,17 @@ class BookmarkAsset(models.Model):
 def bookmark_asset_deleted(sender, instance, **kwargs):
     if instance.file:
         filepath = os.path.join(settings.LD_ASSET_FOLDER, instance.file)
-        if os.path.isfile(filepath):
-            try:
-                os.remove(filepath)
-            except Exception as error:
-                logger.error(f"Failed to delete asset file: {filepath}", exc_info=error)
+        try:
+            os.remove(filepath)
+        except FileNotFoundError:
+            pass
+        except Exception as error:
+            logger.error(f"Failed to delete asset file: {filepath}", exc_info=error)
+
+
+def _parse_iso_date(value):
+    # date.fromisoformat is much faster than datetime.strptime
+    return date.fromisoformat(value) if isinstance(value, str) else value
 
 
 class BookmarkBundle(models.Model):
@@ -203,28 +304,67 @@ class BookmarkBundle(models.Model):
     is_folder = models.BooleanField(default=True)
     search_params = models.JSONField(default=dict, blank=True, verbose_name="搜索参数")
 
+    class Meta:
+        ordering = ["order"]
+        indexes = [models.Index(fields=["owner", "order"], name="bbun_own_ord_idx")]
+
     def __str__(self):
         return self.name
 
-    @property
+    @cached_property
     def search_object(self):
-        """返回基于配置的BookmarkSearch对象"""
+        """返回基于配置的BookmarkSearch对象（按实例缓存，调用方不应修改返回值）"""
         params = self.search_params.copy()
         
         # 反序列化：开始日期、结束日期字符串转date对象
         for date_field in ['date_filter_start', 'date_filter_end']:
             if date_field in params and params[date_field]:
                 try:
-                    if isinstance(params[date_field], str):
-                        params[date_field] = datetime.strptime(
-                            params[date_field], "%Y-%m-%d"
-                        ).date()
+                    params[date_field] = _parse_iso_date(params[date_field])
                 except (ValueError, TypeError):
                     params.pop(date_field, None)
         
         return BookmarkSearch(bundle=self, **params)
 
 
+_EMPTY_PARAMS = {}
+_DATE_BOUND_PARAMS = frozenset(("date_filter_start", "date_filter_end"))
+# 值为模型实例的参数，url中使用其id
+_MODEL_PARAMS = frozenset(("bundle",))
+_RELATIVE_DATE_RE = re.compile(r"last_(\d+)_(day|week|month|year)s?")
+_RELATIVE_DATE_UNIT_DAYS = {"day": 1, "week": 7, "month": 30, "year": 365}
+
+
+@lru_cache(maxsize=256)
+def _parse_relative_date_string(today: date, date_filter_relative_string):
+    if date_filter_relative_string == "today":
+        return today, today
+    elif date_filter_relative_string == "yesterday":
+        yesterday = today - timedelta(days=1)
+        return yesterday, yesterday
+    elif date_filter_relative_string == "this_week":
+        days_since_monday = today.weekday() # weekday() 返回 0-6，0 是周一，6 是周日
+        monday = today - timedelta(days=days_since_monday)
+        sunday = monday + timedelta(days=6)
+        return monday, sunday
+    elif date_filter_relative_string == "this_month":
+        first_day = today.replace(day=1)
+        _, last_day_of_month = calendar.monthrange(today.year, today.month)
+        last_day = today.replace(day=last_day_of_month)
+        return first_day, last_day
+    elif date_filter_relative_string == "this_year":
+        first_day = today.replace(month=1, day=1)
+        last_day = today.replace(month=12, day=31)
+        return first_day, last_day
+    else:
+        m = _RELATIVE_DATE_RE.match(date_filter_relative_string)
+        if m:
+            value, unit = int(m.group(1)), m.group(2)
+            start = today - timedelta(days=value * _RELATIVE_DATE_UNIT_DAYS[unit] - 1)
+            return start, today
+        return None, None
+
+
 class BookmarkSearch:
     SORT_ADDED_ASC = "added_asc"
     SORT_ADDED_DESC = "added_desc"
@@ -254,7 +394,8 @@ class BookmarkSearch:
     FILTER_DATE_TYPE_ABSOLUTE = "absolute"
     FILTER_DATE_TYPE_RELATIVE = "relative"
     
-    params = [
+    # 顺序需与__init__中的参数顺序保持一致
+    params = (
         "q",
         "user",
         "bundle",
@@ -270,8 +411,11 @@ class BookmarkSearch:
         "date_filter_relative_string",
         "date_filter_start",
         "date_filter_end",
-    ]
+    )
+    # 可以直接从请求参数中读取的参数，bundle需要单独查询
+    _request_params = frozenset(params) - {"bundle"}
     preferences = ["sort", "shared", "unread", "tagged", "date_filter_by", "date_filter_type", "date_filter_relative_string"]
+    _preferences_getter = operator.itemgetter(*preferences)
     defaults = {
         "q": "",
         "user": "",
@@ -292,46 +436,8 @@ class BookmarkSearch:
 
     @staticmethod
     def parse_relative_date_string(date_filter_relative_string):
-        today = date.today()
-        if date_filter_relative_string == "today":
-            return today, today
-        elif date_filter_relative_string == "yesterday":
-            yesterday = today - timedelta(days=1)
-            return yesterday, yesterday
-        elif date_filter_relative_string == "this_week":
-            days_since_monday = today.weekday() # weekday() 返回 0-6，0 是周一，6 是周日
-            monday = today - timedelta(days=days_since_monday)
-            sunday = monday + timedelta(days=6)
-            return monday, sunday
-        elif date_filter_relative_string == "this_month":
-            first_day = today.replace(day=1)
-            _, last_day_of_month = calendar.monthrange(today.year, today.month)
-            last_day = today.replace(day=last_day_of_month)
-            return first_day, last_day
-        elif date_filter_relative_string == "this_year":
-            first_day = today.replace(month=1, day=1)
-            last_day = today.replace(month=12, day=31)
-            return first_day, last_day
-        else:
-            m = re.match(r"last_(\d+)_(day|week|month|year)s?", date_filter_relative_string)
-            if m:
-                value, unit = int(m.group(1)), m.group(2)
-                if unit == "day":
-                    start = today - timedelta(days=value - 1)
-                    end = today
-                elif unit == "week":
-                    start = today - timedelta(days=value * 7 - 1)
-                    end = today
-                elif unit == "month":
-                    start = today - timedelta(days=value * 30 - 1)
-                    end = today
-                elif unit == "year":
-                    start = today - timedelta(days=value * 365 - 1)
-                    end = today
-                else:
-                    return None, None
-                return start, end
-            return None, None
+        # 以当天日期作为缓存键的一部分，跨天后自动失效
+        return _parse_relative_date_string(date.today(), date_filter_relative_string)
 
     def __init__(
         self,
@@ -353,31 +459,35 @@ class BookmarkSearch:
         preferences: dict = None,
         request: any = None,
     ):
-        if not preferences:
-            preferences = {}
-        self.defaults = {**BookmarkSearch.defaults, **preferences}
         self.request = request
 
         # 合并参数：user参数 > bundle参数 > default参数
-        user_params = {
-            'q': q, 'user': user, 'bundle': bundle, 'sort': sort, 'shared': shared,
-            'unread': unread, 'tagged': tagged, 'modified_since': modified_since, 'added_since': added_since,
-            'deleted_since': deleted_since, 'date_filter_by': date_filter_by,
-            'date_filter_type': date_filter_type, 'date_filter_relative_string': date_filter_relative_string,
-            'date_filter_start': date_filter_start, 'date_filter_end': date_filter_end
-        }
-        bundle_params = {}
-        if bundle:
-            bundle_params = bundle.search_params
-        for param in self.params:
-            user_value = user_params.get(param)
-            bundle_value = bundle_params.get(param)
-            default_value = self.defaults.get(param)
-            if param in user_params and user_params[param] is not None:
-                final_value = user_value
+        user_values = (
+            q, user, bundle, sort, shared, unread, tagged, modified_since,
+            added_since, deleted_since, date_filter_by, date_filter_type,
+            date_filter_relative_string, date_filter_start, date_filter_end,
+        )
+        # 直接写入__dict__，跳过date_filter_start/end属性的setter
+        values = self.__dict__
+
+        if not preferences and not bundle:
+            # 常见情况：没有偏好设置和Bundle，直接使用类上的默认参数
+            defaults = self.defaults = BookmarkSearch.defaults
+            for param, user_value in zip(self.params, user_values):
+                values[param] = defaults[param] if user_value is None else user_value
+            return
+
+        defaults = self.defaults = (
+            {**BookmarkSearch.defaults, **preferences}
+            if preferences
+            else BookmarkSearch.defaults
+        )
+        bundle_params = bundle.search_params if bundle else _EMPTY_PARAMS
+        for param, user_value in zip(self.params, user_values):
+            if user_value is not None:
+                values[param] = user_value
             else:
-                final_value = bundle_value or default_value
-            setattr(self, param, final_value)
+                values[param] = bundle_params.get(param) or defaults[param]
 
     @property
     def date_filter_start(self):
@@ -405,31 +515,39 @@ class BookmarkSearch:
     def date_filter_end(self, value):
         self.__dict__['date_filter_end'] = value
 
-    def is_modified(self, param):
-        value = self.__dict__[param]
-        
+    @cached_property
+    def _modified_set(self):
         # 日期筛选类型为相对时，隐藏url参数中的开始日期、结束日期
-        if (self.date_filter_type == self.FILTER_DATE_TYPE_RELATIVE and 
-            param in ['date_filter_start', 'date_filter_end']):
-            return False
-            
-        return value != self.defaults[param]
+        hide_date_bounds = self.date_filter_type == self.FILTER_DATE_TYPE_RELATIVE
+        values = self.__dict__
+        defaults = self.defaults
+        return frozenset(
+            param
+            for param in self.params
+            if values[param] != defaults[param]
+            and not (hide_date_bounds and param in _DATE_BOUND_PARAMS)
+        )
 
-    @property
+    def _clear_modified_cache(self):
+        for attr in ("_modified_set", "modified_params", "modified_preferences"):
+            self.__dict__.pop(attr, None)
+
+    def is_modified(self, param):
+        return param in self._modified_set
+
+    @cached_property
     def modified_params(self):
-        return [field for field in self.params if self.is_modified(field)]
+        modified = self._modified_set
+        return [field for field in self.params if field in modified]
 
-    @property
+    @cached_property
     def modified_preferences(self):
-        return [
-            preference
-            for preference in self.preferences
-            if self.is_modified(preference)
-        ]
+        modified = self._modified_set
+        return [preference for preference in self.preferences if preference in modified]
 
     @property
     def has_modifications(self):
-        return len(self.modified_params) > 0
+        return bool(self._modified_set)
 
     @property
     def has_modified_preferences(self):
@@ -442,48 +560,56 @@ class BookmarkSearch:
         if self.bundle:
             query_params["bundle"] = self.bundle.id
             bundle_search_object = self.bundle.search_object
+            self_dict = self.__dict__
+            bundle_dict = bundle_search_object.__dict__
+
+            # 日期参数需通过属性获取（相对日期会覆盖开始、结束日期），循环外只计算一次
+            date_values = {
+                "date_filter_start": (
+                    self.date_filter_start,
+                    bundle_search_object.date_filter_start,
+                ),
+                "date_filter_end": (
+                    self.date_filter_end,
+                    bundle_search_object.date_filter_end,
+                ),
+            }
+            # 日期筛选类型为相对时，或绝对日期与Bundle一致时，url不包含开始、结束日期
+            skip_date_bounds = self.date_filter_type == self.FILTER_DATE_TYPE_RELATIVE or (
+                self.date_filter_type == self.FILTER_DATE_TYPE_ABSOLUTE
+                and all(value == bundle_value for value, bundle_value in date_values.values())
+            )
 
             for param in self.params:
-                # 获取参数值，对于属性需要特殊处理
-                if param in ["date_filter_start", "date_filter_end"]:
-                    value = getattr(self, param)
-                    bundle_value = getattr(bundle_search_object, param)
-                else:
-                    value = self.__dict__[param]
-                    bundle_value = bundle_search_object.__dict__[param]
-
-                # 特殊处理日期相关参数
-                if param in ["date_filter_start", "date_filter_end"]:
-                    if self.date_filter_type == self.FILTER_DATE_TYPE_RELATIVE:
+                if param in date_values:
+                    if skip_date_bounds:
                         continue
-                    elif self.date_filter_type == self.FILTER_DATE_TYPE_ABSOLUTE:
-                        bundle_start = bundle_search_object.date_filter_start
-                        bundle_end = bundle_search_object.date_filter_end
-                        if self.date_filter_start == bundle_start and self.date_filter_end == bundle_end:
-                            continue
+                    value, bundle_value = date_values[param]
+                else:
+                    value = self_dict[param]
+                    bundle_value = bundle_dict[param]
 
                 if value is not None and value != "":
                     if value != bundle_value:  # 用户参数与Bundle参数不同时url包含该参数
-                        if isinstance(value, models.Model):
+                        if param in _MODEL_PARAMS:
                             query_params[param] = value.id
                         else:
                             query_params[param] = value
         else:
             # 没有Bundle时，使用原逻辑（只包含modified_params）
+            self_dict = self.__dict__
             for param in self.modified_params:
-                value = self.__dict__[param]
-                if isinstance(value, models.Model):
+                value = self_dict[param]
+                if param in _MODEL_PARAMS:
                     query_params[param] = value.id
                 else:
                     query_params[param] = value
-        
+
         return query_params
 
     @property
     def preferences_dict(self):
-        return {
-            preference: self.__dict__[preference] for preference in self.preferences
-        }
+        return dict(zip(self.preferences, self._preferences_getter(self.__dict__)))
 
     @staticmethod
     def from_request(request: any, query_dict: QueryDict, preferences: dict = None):
@@ -496,23 +622,34 @@ class BookmarkSearch:
                 owner=request.user, pk=bundle_id
             ).first()
         
-        for param in BookmarkSearch.params:
-            if param == "bundle":
-                continue
+        # 只遍历请求中实际存在的参数
+        for param in BookmarkSearch._request_params.intersection(query_dict.keys()):
             value = query_dict.get(param)
             if value:
                 initial_values[param] = value
         
         if bundle:
-            search = bundle.search_object
+            # 复制一份，避免修改bundle上缓存的search_object
+            search = copy.copy(bundle.search_object)
             for param, value in initial_values.items(): #合并用户参数
                 setattr(search, param, value)
+            search._clear_modified_cache()
             return search
         else:
             return BookmarkSearch(
                 **initial_values, preferences=preferences, request=request
             )
 
+def _copy_search_form_field(field: forms.Field) -> forms.Field:
+    # Fields and widgets only get new attribute values assigned, so shallow
+    # copies are enough. The widget attrs are copied as well, so that no
+    # widget state is shared between forms.
+    field = copy.copy(field)
+    field.widget = copy.copy(field.widget)
+    field.widget.attrs = field.widget.attrs.copy()
+    return field
+
+
 class BookmarkSearchForm(forms.Form):
     SORT_CHOICES = [
         (BookmarkSearch.SORT_ADDED_ASC, "添加时间 ↑"),
@@ -545,21 +682,27 @@ class BookmarkSearchForm(forms.Form):
         (BookmarkSearch.FILTER_DATE_TYPE_RELATIVE, "相对")
     ]
 
-    q = forms.CharField()
-    user = forms.ChoiceField(required=False)
-    bundle = forms.CharField(required=False)
-    sort = forms.ChoiceField(choices=SORT_CHOICES)
-    shared = forms.ChoiceField(choices=FILTER_SHARED_CHOICES, widget=forms.RadioSelect)
-    unread = forms.ChoiceField(choices=FILTER_UNREAD_CHOICES, widget=forms.RadioSelect)
-    tagged = forms.ChoiceField(choices=FILTER_TAGGED_CHOICES, widget=forms.RadioSelect)
-    modified_since = forms.CharField(required=False)
-    added_since = forms.CharField(required=False)
-    deleted_since = forms.CharField(required=False)
-    date_filter_by = forms.ChoiceField(choices=FILTER_DATE_BY_CHOICES, widget=forms.RadioSelect)
-    date_filter_type = forms.ChoiceField(choices=FILTER_DATE_TYPE_CHOICES, widget=forms.RadioSelect)
-    date_filter_start = forms.DateField(required=False, widget=forms.DateInput(attrs={"type": "date"}))
-    date_filter_end = forms.DateField(required=False, widget=forms.DateInput(attrs={"type": "date"}))
-    date_filter_relative_string = forms.CharField(required=False)
+    # The form is only rendered, never bound or validated. Instead of declaring
+    # the fields on the class, which makes BaseForm.__init__ deep copy every
+    # field including its choices, each form builds its fields in __init__
+    # from light copies of these prototypes.
+    FIELD_PROTOTYPES = {
+        "q": forms.CharField(),
+        "user": forms.ChoiceField(required=False),
+        "bundle": forms.CharField(required=False),
+        "sort": forms.ChoiceField(choices=SORT_CHOICES),
+        "shared": forms.ChoiceField(choices=FILTER_SHARED_CHOICES, widget=forms.RadioSelect),
+        "unread": forms.ChoiceField(choices=FILTER_UNREAD_CHOICES, widget=forms.RadioSelect),
+        "tagged": forms.ChoiceField(choices=FILTER_TAGGED_CHOICES, widget=forms.RadioSelect),
+        "modified_since": forms.CharField(required=False),
+        "added_since": forms.CharField(required=False),
+        "deleted_since": forms.CharField(required=False),
+        "date_filter_by": forms.ChoiceField(choices=FILTER_DATE_BY_CHOICES, widget=forms.RadioSelect),
+        "date_filter_type": forms.ChoiceField(choices=FILTER_DATE_TYPE_CHOICES, widget=forms.RadioSelect),
+        "date_filter_start": forms.DateField(required=False, widget=forms.DateInput(attrs={"type": "date"})),
+        "date_filter_end": forms.DateField(required=False, widget=forms.DateInput(attrs={"type": "date"})),
+        "date_filter_relative_string": forms.CharField(required=False),
+    }
 
     def __init__(
         self,
@@ -568,6 +711,10 @@ class BookmarkSearchForm(forms.Form):
         users: List[User] = None,
     ):
         super().__init__()
+        self.fields = {
+            name: _copy_search_form_field(field)
+            for name, field in self.FIELD_PROTOTYPES.items()
+        }
         editable_fields = editable_fields or []
         self.editable_fields = editable_fields
 
@@ -577,6 +724,7 @@ class BookmarkSearchForm(forms.Form):
             user_choices.insert(0, ("", "所有人"))
             self.fields["user"].choices = user_choices
 
+        modified = search._modified_set
         for param in search.params:
             # set initial values for modified params
             if param in ["date_filter_start", "date_filter_end"]:
@@ -594,7 +742,7 @@ class BookmarkSearchForm(forms.Form):
             # Mark non-editable modified fields as hidden. That way, templates
             # rendering a form can just loop over hidden_fields to ensure that
             # all necessary search options are kept when submitting the form.
-            if search.is_modified(param) and param not in editable_fields:
+            if param in modified and param not in editable_fields:
                 self.fields[param].widget = forms.HiddenInput()
 
 
@@ -717,14 +865,30 @@ class UserProfile(models.Model):
     collapse_side_panel = models.BooleanField(default=False, null=False)
     hide_bundles = models.BooleanField(default=False, null=False)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # remember the loaded CSS, so that save can skip hashing it again if
+        # it did not change
+        instance._loaded_custom_css = instance.__dict__.get("custom_css")
+        return instance
+
     def save(self, *args, **kwargs):
-        if self.custom_css:
-            self.custom_css_hash = hashlib.md5(
-                self.custom_css.encode("utf-8")
-            ).hexdigest()
-        else:
-            self.custom_css_hash = ""
+        update_fields = kwargs.get("update_fields")
+        css_updated = update_fields is None or "custom_css" in update_fields
+        if css_updated:
+            if not self.custom_css:
+                self.custom_css_hash = ""
+            elif (
+                getattr(self, "_loaded_custom_css", None) != self.custom_css
+                or not self.custom_css_hash
+            ):
+                self.custom_css_hash = hashlib.blake2b(
+                    self.custom_css.encode("utf-8"), digest_size=16
+                ).hexdigest()
         super().save(*args, **kwargs)
+        if css_updated:
+            self._loaded_custom_css = self.custom_css
 
 
 class UserProfileForm(forms.ModelForm):
@@ -781,6 +945,11 @@ class Toast(models.Model):
     acknowledged = models.BooleanField(default=False)
     owner = models.ForeignKey(User, on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["owner", "acknowledged"], name="toast_own_ack_idx")
+        ]
+
 
 class FeedToken(models.Model):
     """
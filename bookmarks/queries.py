@@ -438,7 +438,8 @@ def query_shared_bookmark_users(
 ) -> QuerySet:
     bookmarks_query = query_shared_bookmarks(None, profile, search, public_only)
 
-    query_set = User.objects.filter(bookmark__in=bookmarks_query)
+    # the user select only needs the names
+    query_set = User.objects.filter(bookmark__in=bookmarks_query).only("id", "username")
 
     return query_set.distinct()
 
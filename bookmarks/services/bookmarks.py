@@ -1,4 +1,5 @@
 import logging
+from datetime import datetime
 from typing import Union
 
 from django.utils import timezone
@@ -107,11 +108,13 @@ def archive_bookmark(bookmark: Bookmark):
     return bookmark
 
 
-def archive_bookmarks(bookmark_ids: [Union[int, str]], current_user: User):
+def archive_bookmarks(
+    bookmark_ids: [Union[int, str]], current_user: User, now: datetime = None
+):
     sanitized_bookmark_ids = _sanitize_id_list(bookmark_ids)
 
     Bookmark.objects.filter(owner=current_user, id__in=sanitized_bookmark_ids).update(
-        is_archived=True, date_modified=timezone.now()
+        is_archived=True, date_modified=now or timezone.now()
     )
 
 
@@ -122,11 +125,13 @@ def unarchive_bookmark(bookmark: Bookmark):
     return bookmark
 
 
-def unarchive_bookmarks(bookmark_ids: [Union[int, str]], current_user: User):
+def unarchive_bookmarks(
+    bookmark_ids: [Union[int, str]], current_user: User, now: datetime = None
+):
     sanitized_bookmark_ids = _sanitize_id_list(bookmark_ids)
 
     Bookmark.objects.filter(owner=current_user, id__in=sanitized_bookmark_ids).update(
-        is_archived=False, date_modified=timezone.now()
+        is_archived=False, date_modified=now or timezone.now()
     )
 
 
@@ -140,10 +145,12 @@ def trash_bookmark(bookmark: Bookmark):
     bookmark.date_deleted = timezone.now()
     bookmark.save()
 
-def trash_bookmarks(bookmark_ids: [Union[int, str]], current_user: User):
+def trash_bookmarks(
+    bookmark_ids: [Union[int, str]], current_user: User, now: datetime = None
+):
     sanitized_bookmark_ids = _sanitize_id_list(bookmark_ids)
     Bookmark.objects.filter(owner=current_user, id__in=sanitized_bookmark_ids).update(
-        is_deleted=True, date_deleted=timezone.now()
+        is_deleted=True, date_deleted=now or timezone.now()
     )
 
 def restore_bookmark(bookmark: Bookmark):
@@ -157,7 +164,12 @@ def restore_bookmarks(bookmark_ids: [Union[int, str]], current_user: User):
         is_deleted=False, date_deleted=None
     )
 
-def tag_bookmarks(bookmark_ids: [Union[int, str]], tag_string: str, current_user: User):
+def tag_bookmarks(
+    bookmark_ids: [Union[int, str]],
+    tag_string: str,
+    current_user: User,
+    now: datetime = None,
+):
     sanitized_bookmark_ids = _sanitize_id_list(bookmark_ids)
     owned_bookmark_ids = Bookmark.objects.filter(
         owner=current_user, id__in=sanitized_bookmark_ids
@@ -176,12 +188,15 @@ def tag_bookmarks(bookmark_ids: [Union[int, str]], tag_string: str, current_user
     # Insert all bookmark -> tag associations at once, should ignore errors if association already exists
     BookmarkToTagRelationShip.objects.bulk_create(relationships, ignore_conflicts=True)
     Bookmark.objects.filter(id__in=owned_bookmark_ids).update(
-        date_modified=timezone.now()
+        date_modified=now or timezone.now()
     )
 
 
 def untag_bookmarks(
-    bookmark_ids: [Union[int, str]], tag_string: str, current_user: User
+    bookmark_ids: [Union[int, str]],
+    tag_string: str,
+    current_user: User,
+    now: datetime = None,
 ):
     sanitized_bookmark_ids = _sanitize_id_list(bookmark_ids)
     owned_bookmark_ids = Bookmark.objects.filter(
@@ -198,39 +213,47 @@ def untag_bookmarks(
         ).delete()
 
     Bookmark.objects.filter(id__in=owned_bookmark_ids).update(
-        date_modified=timezone.now()
+        date_modified=now or timezone.now()
     )
 
 
-def mark_bookmarks_as_read(bookmark_ids: [Union[int, str]], current_user: User):
+def mark_bookmarks_as_read(
+    bookmark_ids: [Union[int, str]], current_user: User, now: datetime = None
+):
     sanitized_bookmark_ids = _sanitize_id_list(bookmark_ids)
 
     Bookmark.objects.filter(owner=current_user, id__in=sanitized_bookmark_ids).update(
-        unread=False, date_modified=timezone.now()
+        unread=False, date_modified=now or timezone.now()
     )
 
 
-def mark_bookmarks_as_unread(bookmark_ids: [Union[int, str]], current_user: User):
+def mark_bookmarks_as_unread(
+    bookmark_ids: [Union[int, str]], current_user: User, now: datetime = None
+):
     sanitized_bookmark_ids = _sanitize_id_list(bookmark_ids)
 
     Bookmark.objects.filter(owner=current_user, id__in=sanitized_bookmark_ids).update(
-        unread=True, date_modified=timezone.now()
+        unread=True, date_modified=now or timezone.now()
     )
 
 
-def share_bookmarks(bookmark_ids: [Union[int, str]], current_user: User):
+def share_bookmarks(
+    bookmark_ids: [Union[int, str]], current_user: User, now: datetime = None
+):
     sanitized_bookmark_ids = _sanitize_id_list(bookmark_ids)
 
     Bookmark.objects.filter(owner=current_user, id__in=sanitized_bookmark_ids).update(
-        shared=True, date_modified=timezone.now()
+        shared=True, date_modified=now or timezone.now()
     )
 
 
-def unshare_bookmarks(bookmark_ids: [Union[int, str]], current_user: User):
+def unshare_bookmarks(
+    bookmark_ids: [Union[int, str]], current_user: User, now: datetime = None
+):
     sanitized_bookmark_ids = _sanitize_id_list(bookmark_ids)
 
     Bookmark.objects.filter(owner=current_user, id__in=sanitized_bookmark_ids).update(
-        shared=False, date_modified=timezone.now()
+        shared=False, date_modified=now or timezone.now()
     )
 
 
@@ -4,7 +4,7 @@ import os.path
 import re
 import time
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 import requests
 from django.conf import settings
@@ -27,7 +27,7 @@ def _url_to_filename(url: str) -> str:
 
 
 def _get_url_parameters(url: str) -> dict:
-    parsed_uri = urlparse(url)
+    parsed_uri = urlsplit(url)
     return {
         # https://example.com/foo?bar -> https://example.com
         "url": f"{parsed_uri.scheme}://{parsed_uri.hostname}",
@@ -92,6 +92,37 @@ def load_favicon(url: str, timeout: int = 10) -> str:
         logger.error(f"An unexpected error occurred during favicon load for {url}: {e}")
         return ""
 
+
+# origin (scheme://hostname) -> favicon file, avoids scanning the favicon folder
+# for hosts that were already loaded by this process
+_favicon_file_cache = {}
+_FAVICON_FILE_CACHE_SIZE = 4096
+
+
+def load_favicon_cached(url: str, timeout: int = 10) -> str:
+    try:
+        origin = _get_url_parameters(url)["url"]
+    except ValueError:
+        return load_favicon(url, timeout=timeout)
+
+    favicon_file = _favicon_file_cache.get(origin)
+    if favicon_file:
+        # a single stat instead of listing the folder, still honor the max age
+        try:
+            if not _is_stale(_get_favicon_path(favicon_file)):
+                return favicon_file
+        except FileNotFoundError:
+            pass
+
+    favicon_file = load_favicon(url, timeout=timeout)
+    # only remember successful loads, failed hosts should be retried
+    if favicon_file:
+        if len(_favicon_file_cache) >= _FAVICON_FILE_CACHE_SIZE:
+            _favicon_file_cache.clear()
+        _favicon_file_cache[origin] = favicon_file
+    return favicon_file
+
+
 def is_favicon_file_exists(url: str) -> bool:
     url_parameters = _get_url_parameters(url)
     favicon_name = _url_to_filename(url_parameters["url"])
@@ -9,10 +9,13 @@ import requests
 from django.conf import settings
 from bookmarks.models import Bookmark
 from bookmarks.services import website_loader
-from bookmarks.utils import get_clean_url
+from bookmarks.utils import delete_expired_files, get_clean_url
 
 logger = logging.getLogger(__name__)
 
+# 临时预览图保留时间（秒），超过后由定期任务清理
+TEMPORARY_PREVIEW_IMAGE_MAX_AGE = 600
+
 
 def _ensure_preview_folder():
     Path(settings.LD_PREVIEW_FOLDER).mkdir(parents=True, exist_ok=True)
@@ -30,6 +33,14 @@ def _get_temporary_image_path(file_name: str) -> Path:
     return Path(settings.LD_PREVIEW_FOLDER) / "tmp" / file_name
 
 
+def delete_expired_temporary_preview_images(max_age: int = TEMPORARY_PREVIEW_IMAGE_MAX_AGE) -> int:
+    temp_folder = Path(settings.LD_PREVIEW_FOLDER) / "tmp"
+    deleted = delete_expired_files(temp_folder, max_age)
+    if deleted:
+        logger.info(f"Deleted {deleted} expired temporary preview image files")
+    return deleted
+
+
 def _url_to_filename(url: str) -> str:
     url = get_clean_url(url)
     return hashlib.md5(url.encode()).hexdigest()
@@ -124,6 +135,8 @@ def load_temporary_preview_image(image_url: str) -> str | None:
             break
 
     if existing_file_path:
+        # 刷新修改时间，避免刚复用的临时文件被定期任务清理
+        os.utime(existing_file_path)
         logger.debug(f"Reusing existing temporary preview image: {existing_file_path}")
         return existing_file_path
 
@@ -0,0 +1,59 @@
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from django.conf import settings
+
+from bookmarks.models import Bookmark
+from bookmarks.services import website_loader
+from bookmarks.utils import delete_expired_files
+
+logger = logging.getLogger(__name__)
+
+# 阅读模式页面内容的缓存时间（秒），过期后重新加载，并由定期任务清理
+READER_CONTENT_MAX_AGE = 600
+
+
+def _get_content_path(bookmark: Bookmark) -> Path:
+    # 文件名包含地址的哈希，修改书签地址后不会读取到旧地址的内容
+    url_hash = hashlib.md5(bookmark.url.encode()).hexdigest()
+    return Path(settings.LD_READER_FOLDER) / f"{bookmark.id}_{url_hash}.html"
+
+
+def get_cached_content(bookmark: Bookmark) -> str | None:
+    path = _get_content_path(bookmark)
+    try:
+        if path.stat().st_mtime < time.time() - READER_CONTENT_MAX_AGE:
+            return None
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def load_content(bookmark: Bookmark) -> str:
+    try:
+        content = website_loader.load_full_page(bookmark.url)
+    except Exception as e:
+        # 加载失败时不写入缓存，下次访问时重新加载
+        return f"<html><body><p>无法加载页面内容：{str(e)}</p></body></html>"
+
+    # 先写入临时文件再替换，避免读取到写了一半的内容
+    path = _get_content_path(bookmark)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+    ) as temp_file:
+        temp_file.write(content)
+    os.replace(temp_file.name, path)
+
+    return content
+
+
+def delete_expired_content(max_age: int = READER_CONTENT_MAX_AGE) -> int:
+    deleted = delete_expired_files(settings.LD_READER_FOLDER, max_age)
+    if deleted:
+        logger.info(f"Deleted {deleted} expired reader content files")
+    return deleted
@@ -3,6 +3,7 @@ import os
 import shlex
 import signal
 import subprocess
+from collections.abc import Mapping
 
 from django.conf import settings
 
@@ -27,7 +28,7 @@ def get_custom_options(config: dict):
 
     args = []
     
-    if isinstance(custom_options, dict):
+    if isinstance(custom_options, Mapping):
         for arg, value in custom_options.items():
             args.append(arg + "=" + value)
     else:
@@ -16,13 +16,12 @@ logger = logging.getLogger(__name__)
 
 
 # 缓存规则设置与解析规则（function）
-_settings_cache = None
-_processors_module_cache = {}  # {loader_path: (module, mtime)}
+_processors_module_cache = {}  # {loader_path: (module, mtime, last_stat_time)}
 
 # 创建快照： 快照总调度
 def create_snapshot(url: str, filepath: str):
     settings_path = settings.LD_CUSTOM_SNAPSHOT_PROCESSOR_SETTINGS
-    config = search_config_for_domain(url, settings_path, _settings_cache)
+    config = search_config_for_domain(url, settings_path)
 
     if config:
         processor_file = config.get("processor")
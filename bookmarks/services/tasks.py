@@ -14,7 +14,7 @@ from huey.exceptions import TaskLockedException
 from waybackpy.exceptions import WaybackError, TooManyRequestsError
 
 from bookmarks.models import Bookmark, BookmarkAsset, UserProfile
-from bookmarks.services import assets, favicon_loader, preview_image_loader
+from bookmarks.services import assets, favicon_loader, preview_image_loader, reader
 from bookmarks.services.website_loader import load_website_metadata
 
 logger = logging.getLogger(__name__)
@@ -195,6 +195,7 @@ def load_preview_image(user: User, bookmark: Bookmark):
         _load_preview_image_task(bookmark.id)
 
 
+# 保留此任务，使已在队列中的旧任务仍可执行，新的临时文件由下面的定期任务统一清理
 @task()
 def delete_preview_image_temp_file(filepath: str):
     logger.debug(f"Followed temporary preview image file will be deleted after a while: {filepath}")
@@ -242,6 +243,22 @@ def _schedule_bookmarks_without_previews_task(user_id: int):
             logging.exception(exc)
 
 
+def load_reader_content(bookmark: Bookmark):
+    if not settings.LD_DISABLE_BACKGROUND_TASKS:
+        _load_reader_content_task(bookmark.id)
+
+
+@task()
+def _load_reader_content_task(bookmark_id: int):
+    try:
+        bookmark = Bookmark.objects.get(id=bookmark_id)
+    except Bookmark.DoesNotExist:
+        return
+
+    logger.info(f"Load reader content for bookmark. url={bookmark.url}")
+    reader.load_content(bookmark)
+
+
 def refresh_metadata(bookmark: Bookmark):
     if not settings.LD_DISABLE_BACKGROUND_TASKS:
         _refresh_metadata_task(bookmark.id)
@@ -308,6 +325,16 @@ def create_html_snapshots(bookmark_list: List[Bookmark]):
     BookmarkAsset.objects.bulk_create(assets_to_create)
 
 
+@huey.periodic_task(crontab(minute="*/5"))
+def _delete_expired_temporary_preview_images_task():
+    preview_image_loader.delete_expired_temporary_preview_images()
+
+
+@huey.periodic_task(crontab(minute="*/5"))
+def _delete_expired_reader_content_task():
+    reader.delete_expired_content()
+
+
 # singe-file does not support running multiple instances in parallel, so we can
 # not queue up multiple snapshot tasks at once. Instead, schedule a periodic
 # task that grabs a number of pending assets and creates snapshots for them in
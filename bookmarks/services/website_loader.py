@@ -1,14 +1,20 @@
+import html
 import json
 import logging
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from functools import lru_cache
 from urllib.parse import urljoin
 
 import importlib.util
 import requests
-from http.cookies import SimpleCookie
-from bs4 import BeautifulSoup
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
+from lxml import etree
 from bookmarks.utils import get_domain, load_module, search_config_for_domain, load_settings
 from charset_normalizer import from_bytes
 from django.conf import settings
@@ -37,14 +43,39 @@ class WebsiteMetadata:
 
 
 # 缓存规则设置与解析规则（function）
-_settings_cache = None
-_loaders_module_cache = {}  # {loader_path: (module, mtime)}
+_loaders_module_cache = {}  # {loader_path: (module, mtime, last_stat_time)}
+
+
+def _create_session():
+    """
+    复用连接的 Session：批量加载时避免对每个地址重新建立 TCP/TLS 连接。
+    requests 不保证 Session 线程安全，通过 _get_session 为每个线程创建一个
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # Don't persist cookies set by websites across requests, only send
+    # cookies that are configured explicitly for a site
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+_thread_local = threading.local()
+
+
+def _get_session():
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _create_session()
+        _thread_local.session = session
+    return session
+
 
 # 获取网站标题、描述、首图
-# TODO: 目前一旦用户有自定义字段，就会失去缓存，暂时没考虑好传递config dict时的缓存方案
 def load_website_metadata(url: str, ignore_cache: bool = False):
     settings_path = settings.LD_CUSTOM_WEBSITE_LOADER_SETTINGS
-    config = search_config_for_domain(url, settings_path, _settings_cache)
+    config = search_config_for_domain(url, settings_path)
         
     if config:
         loader_file = config.get("loader")
@@ -55,7 +86,12 @@ def load_website_metadata(url: str, ignore_cache: bool = False):
                 func = getattr(module, "_load_website_metadata")
                 return func(url, config)
         else:
-            return _load_website_metadata(url, config)
+            if ignore_cache:
+                return _load_website_metadata(url, config)
+            # 自定义字段序列化后作为缓存键的一部分，配置变化时不会命中旧结果
+            return _load_website_metadata_cached(
+                url, json.dumps(config, sort_keys=True, default=dict)
+            )
 
     if ignore_cache:
         return _load_website_metadata(url)
@@ -63,11 +99,34 @@ def load_website_metadata(url: str, ignore_cache: bool = False):
 
 
 
+# 元数据缓存的有效期（秒）与最大条目数，过期后重新抓取，避免长期返回旧的标题、描述
+METADATA_CACHE_TTL = 300
+METADATA_CACHE_SIZE = 128
+
+_metadata_cache = OrderedDict()  # {(url, config_json): (metadata, deadline)}
+# 请求线程与任务线程会同时读写缓存，查找与更新需要加锁；加载页面时不持有锁
+_metadata_cache_lock = threading.Lock()
+
+
 # Caching metadata avoids scraping again when saving bookmarks, in case the
 # metadata was already scraped to show preview values in the bookmark form
-@lru_cache(maxsize=10)
-def _load_website_metadata_cached(url: str):
-    return _load_website_metadata(url)
+def _load_website_metadata_cached(url: str, config_json: str = None):
+    key = (url, config_json)
+    with _metadata_cache_lock:
+        cached = _metadata_cache.get(key)
+        if cached and cached[1] > time.monotonic():
+            _metadata_cache.move_to_end(key)
+            return cached[0]
+
+    config = json.loads(config_json) if config_json else None
+    metadata = _load_website_metadata(url, config)
+
+    with _metadata_cache_lock:
+        _metadata_cache[key] = (metadata, time.monotonic() + METADATA_CACHE_TTL)
+        _metadata_cache.move_to_end(key)
+        while len(_metadata_cache) > METADATA_CACHE_SIZE:
+            _metadata_cache.popitem(last=False)
+    return metadata
 
 
 def _load_website_metadata(url: str, config: dict = None):
@@ -81,44 +140,29 @@ def _load_website_metadata(url: str, config: dict = None):
         logger.debug(f"Load duration: {end - start}")
 
         start = timezone.now()
-        soup = BeautifulSoup(page_text, "html.parser")
-
-        if soup.title and soup.title.string:
-            title = soup.title.string.strip()
-        else:
-            title_tag = soup.find("meta", attrs={"property": "og:title"})
-            title = (
-                title_tag["content"].strip()
-                if title_tag and title_tag["content"]
-                else None
-            )
-        description_tag = soup.find("meta", attrs={"name": "description"})
-        description = (
-            description_tag["content"].strip()
-            if description_tag and description_tag["content"]
-            else None
+        head = _extract_head_metadata_fast(page_text)
+        if head is None:
+            # 使用 lxml (libxml2) 解析，比纯 Python 的 html.parser 快得多
+            head = _HeadMetadataTarget()
+            parser = etree.HTMLParser(target=head)
+            try:
+                parser.feed(page_text)
+                parser.close()
+            except _EndOfHead:
+                # head 结束后不再继续解析文档剩余部分
+                pass
+
+        title = head.title or head.meta.get(("property", "og:title"))
+        description = head.meta.get(("name", "description")) or head.meta.get(
+            ("property", "og:description")
         )
 
-        if not description:
-            description_tag = soup.find("meta", attrs={"property": "og:description"})
-            description = (
-                description_tag["content"].strip()
-                if description_tag and description_tag["content"]
-                else None
-            )
-
         # 获取预览图，依次查找如下标签：meta；link
-        image_tag_meta = (
-            soup.find("meta", attrs={"property": "og:image"}) 
-            or soup.find("meta", attrs={"name": "og:image"})
+        preview_image = (
+            head.meta.get(("property", "og:image"))
+            or head.meta.get(("name", "og:image"))
+            or head.preload_image
         )
-        image_tag_link = soup.find("link", attrs={"rel": "preload", "as": "image"})
-
-        preview_image = None
-        if image_tag_meta:
-            preview_image = image_tag_meta["content"].strip()
-        elif image_tag_link:
-            preview_image = image_tag_link["href"].strip()
 
         if (
             preview_image
@@ -135,6 +179,146 @@ def _load_website_metadata(url: str, config: dict = None):
         )
 
 
+_HEAD_END_RE = re.compile(r"</head\s*>", re.I)
+_TITLE_RE = re.compile(r"<title\b[^>]*>(.*?)</title\s*>", re.I | re.S)
+_META_LINK_RE = re.compile(r"<(meta|link)\b([^>]*)>", re.I)
+_ATTRIBUTE_RE = re.compile(
+    r"""([^\s"'=<>/]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+)))?"""
+)
+# 注释、脚本等块中的内容不是标签，可能包含看起来像 meta 的文本，交给 lxml 处理
+_UNSAFE_HEAD_RE = re.compile(r"<!--|<(?:script|noscript|template)\b", re.I)
+
+
+def _extract_head_metadata_fast(page_text: str):
+    """
+    使用正则表达式直接提取 head 中的 title、meta 与 link 标签，无需逐个节点解析。
+    仅处理结构规整的 head，遇到注释、script/noscript/template 块、无法完整解析的
+    标签或未找到任何元数据时返回 None，由 lxml 解析兜底
+    """
+    head_end = _HEAD_END_RE.search(page_text)
+    if not head_end:
+        return None
+    head_text = page_text[: head_end.start()]
+    if _UNSAFE_HEAD_RE.search(head_text):
+        return None
+
+    head = _HeadMetadataTarget()
+    title_match = _TITLE_RE.search(head_text)
+    if title_match:
+        title = title_match.group(1)
+        if "<" in title:
+            return None
+        title = html.unescape(title)
+        if title:
+            head.title = title.strip()
+
+    for match in _META_LINK_RE.finditer(head_text):
+        tag, attributes = match.groups()
+        tag = tag.lower()
+        # 跳过不可能包含所需元数据的标签（如样式表、charset 声明）
+        marker = "content" if tag == "meta" else "preload"
+        if marker not in attributes.lower():
+            continue
+        # 属性值中包含 > 等情况时，标签会被截断，此时放弃快速提取
+        if _ATTRIBUTE_RE.sub("", attributes).strip(" \t\n\r\f/"):
+            return None
+        attrib = {}
+        for name, double_quoted, single_quoted, unquoted in _ATTRIBUTE_RE.findall(
+            attributes
+        ):
+            value = double_quoted or single_quoted or unquoted
+            if "&" in value:
+                value = html.unescape(value)
+            attrib.setdefault(name.lower(), value)
+        head.start(tag, attrib)
+
+    if head.title is None and not head.meta and head.preload_image is None:
+        return None
+    return head
+
+
+class _EndOfHead(Exception):
+    pass
+
+
+class _HeadMetadataTarget:
+    """
+    lxml 解析器的 target：在一次遍历中收集标题、描述与预览图，
+    读到 </head> 后抛出 _EndOfHead 中止解析，不构建文档树
+    """
+
+    META_KEYS = {
+        ("property", "og:title"),
+        ("name", "description"),
+        ("property", "og:description"),
+        ("property", "og:image"),
+        ("name", "og:image"),
+    }
+
+    def __init__(self):
+        self.title = None
+        self.meta = {}
+        self.preload_image = None
+        self._title_parts = None
+        self._in_title = False
+
+    def start(self, tag, attrib):
+        if tag == "title":
+            # Only the first title element counts
+            if self._title_parts is None:
+                self._title_parts = []
+                self._in_title = True
+        elif tag == "meta":
+            content = attrib.get("content")
+            if not content or not content.strip():
+                return
+            for attr in ("property", "name"):
+                key = (attr, attrib.get(attr))
+                if key in self.META_KEYS and key not in self.meta:
+                    self.meta[key] = content.strip()
+        elif tag == "link" and self.preload_image is None:
+            rel = (attrib.get("rel") or "").split()
+            href = attrib.get("href")
+            if "preload" in rel and attrib.get("as") == "image" and href:
+                self.preload_image = href.strip()
+
+    def end(self, tag):
+        if tag == "title" and self._in_title:
+            self._in_title = False
+            title = "".join(self._title_parts)
+            if title:
+                self.title = title.strip()
+        elif tag == "head":
+            raise _EndOfHead()
+
+    def data(self, data):
+        if self._in_title:
+            self._title_parts.append(data)
+
+    def close(self):
+        return self
+
+
+_END_OF_HEAD = b"</head>"
+_END_OF_HEAD_LENGTH = len(_END_OF_HEAD)
+
+# 编码检测先在常见编码中进行，避免遍历所有编码
+_DETECTED_ENCODINGS = [
+    "utf_8",
+    "gb18030",
+    "big5",
+    "shift_jis",
+    "euc_jp",
+    "euc_kr",
+    "cp1251",
+    "cp1252",
+]
+
+# 单字节编码几乎能解码任意内容，容易把 koi8-r、iso-8859-x 等页面误判为乱码，
+# 匹配到这些编码时再用完整的候选编码检测一次，取两者中更好的结果
+_AMBIGUOUS_ENCODINGS = {"cp1251", "cp1252"}
+
+
 def load_page(url: str, config: dict = None):
     headers = build_request_headers(config)
     cookies = build_request_cookies(config)
@@ -142,43 +326,62 @@ def load_page(url: str, config: dict = None):
     proxies = config.get("proxy") if config else None
 
 
-    CHUNK_SIZE = config.get("chunk_size", 50*1024) if config else 50*1024
+    # 较大的读取块可以减少 recv 调用次数，多数页面的 head 一次即可读完
+    CHUNK_SIZE = config.get("chunk_size", 256*1024) if config else 256*1024
     MAX_CONTENT_LIMIT = config.get("max_content_limit", 5000*1024) if config else 5000*1024
 
     size = 0
-    content = None
+    # 使用 bytearray 累积内容，避免 bytes 拼接导致的 O(n²) 复制
+    content = bytearray()
+    extend = content.extend
+    find = content.find
     iteration = 0
+    # 关闭调试日志时跳过日志消息的格式化
+    debug = logger.isEnabledFor(logging.DEBUG)
     # Use with to ensure request gets closed even if it's only read partially
-    with requests.get(url, timeout=timeout, headers=headers, cookies=cookies, proxies=proxies, stream=True) as r:
+    with _get_session().get(url, timeout=timeout, headers=headers, cookies=cookies, proxies=proxies, stream=True) as r:
         for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
             size += len(chunk)
             iteration = iteration + 1
-            if content is None:
-                content = chunk
-            else:
-                content = content + chunk
+            extend(chunk)
 
-            logger.debug(f"Loaded chunk (iteration={iteration}, total={size / 1024})")
+            if debug:
+                logger.debug(f"Loaded chunk (iteration={iteration}, total={size / 1024})")
 
             # Stop reading if we have parsed end of head tag
-            end_of_head = "</head>".encode("utf-8")
-            if end_of_head in content:
-                logger.debug(f"Found closing head tag after {size} bytes")
-                content = content.split(end_of_head)[0] + end_of_head
+            # Only scan the newly added tail, the tag might span two chunks
+            index = find(_END_OF_HEAD, max(0, size - len(chunk) - _END_OF_HEAD_LENGTH))
+            if index != -1:
+                if debug:
+                    logger.debug(f"Found closing head tag after {size} bytes")
+                del content[index + _END_OF_HEAD_LENGTH:]
                 break
             # Stop reading if we exceed limit
             if size > MAX_CONTENT_LIMIT:
-                logger.debug(f"Cancel reading document after {size} bytes")
+                if debug:
+                    logger.debug(f"Cancel reading document after {size} bytes")
                 break
-        if hasattr(r, "_content_consumed"):
+        if debug and hasattr(r, "_content_consumed"):
             logger.debug(f"Request consumed: {r._content_consumed}")
 
+    # Most pages are UTF-8, which can be verified with a strict decode
+    # without running encoding detection
+    try:
+        return content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        pass
+
     # Use charset_normalizer to determine encoding that best matches the response content
     # Several sites seem to specify the response encoding incorrectly, so we ignore it and use custom logic instead
     # This is different from Response.text which does respect the encoding specified in the response first,
     # before trying to determine one
-    results = from_bytes(content or "")
-    return str(results.best())
+    content = bytes(content)
+    best = from_bytes(content, cp_isolation=_DETECTED_ENCODINGS).best()
+    if best is None or best.encoding in _AMBIGUOUS_ENCODINGS:
+        fallback = from_bytes(content).best()
+        if fallback is not None and (best is None or fallback < best):
+            best = fallback
+    return str(best)
 
 
 def load_full_page(url: str, config: dict = None):
@@ -191,7 +394,7 @@ def load_full_page(url: str, config: dict = None):
     proxies = config.get("proxy") if config else None
     
     try:
-        response = requests.get(url, timeout=timeout, headers=headers, cookies=cookies, proxies=proxies)
+        response = _get_session().get(url, timeout=timeout, headers=headers, cookies=cookies, proxies=proxies)
         response.raise_for_status()
         return response.text
     except requests.exceptions.RequestException as e:
@@ -200,27 +403,43 @@ def load_full_page(url: str, config: dict = None):
 
 
 def build_request_headers(config: dict = None):
-    headers = {
+    """
+    未配置自定义请求头时返回共享的默认请求头，调用方不应修改返回值
+    """
+    default_headers = _default_request_headers(settings.LD_DEFAULT_USER_AGENT)
+    if not (config and config.get("headers")):
+        return default_headers
+
+    headers = {**default_headers, **config["headers"]}
+    headers.pop("Cookie", None)  # 剔除Cookie，由 build_request_cookies 处理
+    return headers
+
+
+@lru_cache(maxsize=1)
+def _default_request_headers(user_agent: str):
+    return {
         "Accept": "text/html,application/xhtml+xml,application/xml",
         "Accept-Encoding": "gzip, deflate",
         "Dnt": "1",
         "Upgrade-Insecure-Requests": "1",
-        "User-Agent": settings.LD_DEFAULT_USER_AGENT,
+        "User-Agent": user_agent,
     }
-    if config and config.get("headers"):
-        headers.update(config["headers"])
-        if config.get("headers",{}).get("Cookie"): # 剔除Cookie
-            headers.pop("Cookie", None)
-    return headers
 
 def build_request_cookies(config: dict = None) -> dict:
     cookies = {}
-    cookies_str = config.get("headers",{}).get("Cookie") if config else None
+    cookies_str = config.get("headers", {}).get("Cookie") if config else None
     if cookies_str:
         try:
-            simple_cookie = SimpleCookie()
-            simple_cookie.load(cookies_str)
-            cookies = {key: value.value for key, value in simple_cookie.items()}
+            # Cookie 请求头只是 name=value 对的列表，直接拆分即可
+            for part in cookies_str.split(";"):
+                key, separator, value = part.partition("=")
+                key = key.strip()
+                if separator and key:
+                    value = value.strip()
+                    # 与 SimpleCookie 一致，去掉值外层的一对双引号
+                    if len(value) >= 2 and value[0] == value[-1] == '"':
+                        value = value[1:-1]
+                    cookies[key] = value
         except Exception as e:
             logger.warning(f"Failed to parse cookies '{cookies_str}': {e}")
             return cookies
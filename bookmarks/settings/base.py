@@ -289,6 +289,9 @@ LD_PREVIEW_ALLOWED_EXTENSIONS = [
     ".webp"
 ]
 
+# Reader mode settings
+LD_READER_FOLDER = os.path.join(BASE_DIR, "data", "reader")
+
 # Website loader / snapshot settings
 LD_DEFAULT_USER_AGENT = os.getenv("LD_DEFAULT_USER_AGENT", "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36 Edg/138.0.0.0")
 LD_CUSTOM_WEBSITE_LOADER_SETTINGS = os.getenv("LD_CUSTOM_WEBSITE_LOADER_SETTINGS","data/website_loader/settings.json")
@@ -5,7 +5,6 @@ import markdown
 from bleach_allowlist import markdown_tags, markdown_attrs
 from django import template
 from django.utils.safestring import mark_safe
-from urllib.parse import urlparse
 
 from bookmarks import utils
 from bookmarks.models import UserProfile
@@ -184,7 +183,7 @@ def form_field(field, modifier_string):
 @register.filter
 def extract_domain(value, user_profile=None):
     try:
-        netloc = urlparse(value).netloc
+        netloc = utils.get_domain(value)
         # 获取用户自定义规则
         domain_roots = []
         if user_profile and hasattr(user_profile, 'custom_domain_root') and user_profile.custom_domain_root:
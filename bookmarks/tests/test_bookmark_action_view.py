@@ -794,6 +794,23 @@ class BookmarkActionViewTestCase(
 
         self.assertEqual(0, Bookmark.objects.count())
 
+    def test_bulk_select_across_processes_ids_in_chunks(self):
+        self.setup_numbered_bookmarks(25)
+
+        with patch("bookmarks.views.bookmarks.BULK_ACTION_CHUNK_SIZE", 10):
+            self.client.post(
+                reverse("linkding:bookmarks.index.action"),
+                {
+                    "bulk_action": ["bulk_archive"],
+                    "bulk_execute": [""],
+                    "bulk_select_across": ["on"],
+                },
+            )
+
+        self.assertEqual(25, Bookmark.objects.filter(is_archived=True).count())
+        # all chunks use the same timestamp
+        self.assertEqual(1, Bookmark.objects.values("date_modified").distinct().count())
+
     def setup_bulk_edit_scope_test_data(self):
         # create a number of bookmarks with different states / visibility
         self.setup_numbered_bookmarks(3, with_tags=True)
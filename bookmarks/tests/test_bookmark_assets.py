@@ -1,8 +1,10 @@
 import os
+from unittest import mock
 
 from django.conf import settings
 from django.test import TestCase
 
+from bookmarks.models import BookmarkAsset
 from bookmarks.services import bookmarks
 from bookmarks.tests.helpers import BookmarkFactoryMixin
 
@@ -79,3 +81,20 @@ class BookmarkAssetsTestCase(TestCase, BookmarkFactoryMixin):
         # Create asset with initial file
         asset = self.setup_asset(bookmark=bookmark, file="temp.html.gz")
         self.assertEqual(asset.file_size, 4)
+
+    def test_save_skips_file_size_update_when_file_unchanged(self):
+        bookmark = self.setup_bookmark()
+        self.setup_asset_file("temp.html.gz")
+        asset = self.setup_asset(bookmark=bookmark, file="temp.html.gz")
+        asset = BookmarkAsset.objects.get(id=asset.id)
+
+        with mock.patch("bookmarks.models.os.stat") as mock_stat:
+            asset.display_name = "Renamed"
+            asset.save()
+            mock_stat.assert_not_called()
+
+        self.setup_asset_file("other.html.gz")
+        asset.file = "other.html.gz"
+        asset.file_size = None
+        asset.save()
+        self.assertEqual(asset.file_size, 4)
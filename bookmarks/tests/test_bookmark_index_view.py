@@ -438,6 +438,21 @@ class BookmarkIndexViewTestCase(
             response.url, reverse("linkding:bookmarks.index") + "?q=foo&sort=title_asc"
         )
 
+    def test_search_action_only_reseeds_random_sort_on_reshuffle(self):
+        # selecting random sort keeps the session untouched
+        self.client.post(
+            reverse("linkding:bookmarks.index"),
+            {"sort": BookmarkSearch.SORT_RANDOM},
+        )
+        self.assertNotIn("random_sort_seed", self.client.session)
+
+        # explicit reshuffle generates a seed
+        self.client.post(
+            reverse("linkding:bookmarks.index"),
+            {"sort": BookmarkSearch.SORT_RANDOM, "reshuffle": "1"},
+        )
+        self.assertIn("random_sort_seed", self.client.session)
+
     def test_save_search_preferences(self):
         user_profile = self.user.profile
 
@@ -603,6 +618,18 @@ class BookmarkIndexViewTestCase(
 
         self.assertVisibleBundles(soup, [music, tools, books])
 
+    def test_create_bundle_link_includes_search_params(self):
+        bundle = self.setup_bundle(search="foo")
+        url = reverse("linkding:bookmarks.index") + f"?q=bar&bundle={bundle.id}"
+        response = self.client.get(url)
+        soup = self.make_soup(response.content.decode())
+
+        link = soup.select_one(f'a[href^="{reverse("linkding:bundles.new")}?"]')
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(link["href"]).query)
+        self.assertEqual(["bar"], query["q"])
+        self.assertEqual([str(bundle.id)], query["bundle"])
+        self.assertEqual([BookmarkSearch.SORT_ADDED_DESC], query["sort"])
+
     def test_list_bundles_only_shows_user_owned_bundles(self):
         user_bundles = [self.setup_bundle(), self.setup_bundle(), self.setup_bundle()]
         other_user = self.setup_user()
@@ -0,0 +1,112 @@
+import tempfile
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from bookmarks.services import reader
+from bookmarks.tests.helpers import BookmarkFactoryMixin
+from bookmarks.views.bookmarks import READER_MAX_POLL_ATTEMPTS
+
+
+class BookmarkReadViewTestCase(TestCase, BookmarkFactoryMixin):
+
+    def setUp(self) -> None:
+        user = self.get_or_create_test_user()
+        self.client.force_login(user)
+
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.settings_override = self.settings(LD_READER_FOLDER=self.temp_folder.name)
+        self.settings_override.enable()
+
+        self.load_full_page_patcher = patch(
+            "bookmarks.services.website_loader.load_full_page",
+            return_value="<html><body><p>Page content</p></body></html>",
+        )
+        self.mock_load_full_page = self.load_full_page_patcher.start()
+        self.schedule_patcher = patch("bookmarks.services.tasks.load_reader_content")
+        self.mock_load_reader_content = self.schedule_patcher.start()
+
+    def tearDown(self) -> None:
+        self.schedule_patcher.stop()
+        self.load_full_page_patcher.stop()
+        self.settings_override.disable()
+        self.temp_folder.cleanup()
+
+    def read_url(self, bookmark, attempt=None):
+        url = reverse("linkding:bookmarks.read", args=[bookmark.id])
+        return url if attempt is None else f"{url}?attempt={attempt}"
+
+    def test_schedules_loading_and_returns_loading_page(self):
+        bookmark = self.setup_bookmark()
+
+        response = self.client.get(self.read_url(bookmark))
+
+        self.assertTemplateUsed(response, "bookmarks/read_loading.html")
+        self.assertContains(response, self.read_url(bookmark, 1))
+        self.mock_load_reader_content.assert_called_once_with(bookmark)
+        self.mock_load_full_page.assert_not_called()
+
+    def test_polling_does_not_schedule_again(self):
+        bookmark = self.setup_bookmark()
+
+        response = self.client.get(self.read_url(bookmark, 1))
+
+        self.assertTemplateUsed(response, "bookmarks/read_loading.html")
+        self.assertContains(response, self.read_url(bookmark, 2))
+        self.mock_load_reader_content.assert_not_called()
+
+    def test_renders_loaded_content(self):
+        bookmark = self.setup_bookmark()
+        reader.load_content(bookmark)
+        self.mock_load_full_page.reset_mock()
+
+        response = self.client.get(self.read_url(bookmark, 1))
+
+        self.assertTemplateUsed(response, "bookmarks/read.html")
+        self.assertContains(response, "Page content")
+        self.mock_load_full_page.assert_not_called()
+
+    def test_loads_content_in_request_after_max_poll_attempts(self):
+        bookmark = self.setup_bookmark()
+
+        response = self.client.get(self.read_url(bookmark, READER_MAX_POLL_ATTEMPTS))
+
+        self.assertTemplateUsed(response, "bookmarks/read.html")
+        self.assertContains(response, "Page content")
+        self.mock_load_full_page.assert_called_once_with(bookmark.url)
+
+    @override_settings(LD_DISABLE_BACKGROUND_TASKS=True)
+    def test_loads_content_in_request_when_background_tasks_are_disabled(self):
+        bookmark = self.setup_bookmark()
+
+        response = self.client.get(self.read_url(bookmark))
+
+        self.assertTemplateUsed(response, "bookmarks/read.html")
+        self.assertContains(response, "Page content")
+        self.mock_load_reader_content.assert_not_called()
+
+    def test_shows_error_when_page_can_not_be_loaded(self):
+        bookmark = self.setup_bookmark()
+        self.mock_load_full_page.side_effect = Exception("timeout")
+
+        response = self.client.get(self.read_url(bookmark, READER_MAX_POLL_ATTEMPTS))
+
+        self.assertContains(response, "无法加载页面内容：timeout")
+
+    def test_does_not_cache_error_content(self):
+        bookmark = self.setup_bookmark()
+        self.mock_load_full_page.side_effect = Exception("timeout")
+        reader.load_content(bookmark)
+
+        self.assertIsNone(reader.get_cached_content(bookmark))
+
+    def test_does_not_return_cached_content_after_url_change(self):
+        bookmark = self.setup_bookmark(url="https://example.com/old")
+        reader.load_content(bookmark)
+        self.assertIsNotNone(reader.get_cached_content(bookmark))
+
+        bookmark.url = "https://example.com/new"
+        bookmark.save()
+
+        self.assertIsNone(reader.get_cached_content(bookmark))
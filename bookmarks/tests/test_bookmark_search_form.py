@@ -93,3 +93,43 @@ class BookmarkSearchFormTest(TestCase, BookmarkFactoryMixin):
         )
         form = BookmarkSearchForm(search, editable_fields=["q", "user"])
         self.assertCountEqual(form.hidden_fields(), [form["sort"]])
+
+    def test_does_not_modify_field_prototypes(self):
+        users = [self.setup_user("user1")]
+        search = BookmarkSearch(q="search query", sort=BookmarkSearch.SORT_ADDED_ASC)
+        form = BookmarkSearchForm(search, users=users)
+        self.assertCountEqual(form.hidden_fields(), [form["q"], form["sort"]])
+
+        base_fields = BookmarkSearchForm.FIELD_PROTOTYPES
+        self.assertIsNone(base_fields["q"].initial)
+        self.assertFalse(base_fields["q"].widget.is_hidden)
+        self.assertFalse(base_fields["sort"].widget.is_hidden)
+        self.assertEqual(base_fields["user"].choices, [])
+        self.assertEqual(base_fields["user"].widget.choices, [])
+
+        form = BookmarkSearchForm(BookmarkSearch())
+        self.assertEqual(len(form.hidden_fields()), 0)
+        self.assertEqual(form["q"].initial, "")
+
+    def test_forms_do_not_share_widget_state(self):
+        search = BookmarkSearch(q="search query")
+        form = BookmarkSearchForm(search)
+        other_form = BookmarkSearchForm(search, editable_fields=["q"])
+
+        for name in BookmarkSearchForm.FIELD_PROTOTYPES:
+            with self.subTest(field=name):
+                self.assertIsNot(
+                    form.fields[name].widget, other_form.fields[name].widget
+                )
+
+        form.fields["sort"].widget.attrs["class"] = "form-select"
+        form.fields["q"].widget.input_type = "search"
+
+        self.assertNotIn("class", other_form.fields["sort"].widget.attrs)
+        self.assertEqual("text", other_form.fields["q"].widget.input_type)
+        self.assertNotIn(
+            "class", BookmarkSearchForm.FIELD_PROTOTYPES["sort"].widget.attrs
+        )
+        self.assertEqual(
+            "text", BookmarkSearchForm.FIELD_PROTOTYPES["q"].widget.input_type
+        )
@@ -1,3 +1,6 @@
+from datetime import date
+from unittest import mock
+
 from django.http import QueryDict
 from django.test import TestCase
 
@@ -100,6 +103,29 @@ class BookmarkSearchModelTest(TestCase, BookmarkFactoryMixin):
         search = BookmarkSearch.from_request(request, query_dict)
         self.assertIsNone(search.bundle)
 
+    def test_from_request_with_bundle_keeps_bundle_search_object(self):
+        bundle = self.setup_bundle()
+        bundle.search_params = {"sort": BookmarkSearch.SORT_TITLE_ASC}
+        bundle_search = bundle.search_object
+        self.assertIs(bundle.search_object, bundle_search)
+
+        request = MockRequest(self.get_or_create_test_user())
+        query_dict = QueryDict(f"bundle={bundle.id}&q=search query&sort=title_desc")
+        search = BookmarkSearch.from_request(request, query_dict)
+        search.bundle = bundle
+
+        self.assertIsNot(search, bundle_search)
+        self.assertEqual(bundle_search.q, "")
+        self.assertEqual(bundle_search.sort, BookmarkSearch.SORT_TITLE_ASC)
+        self.assertEqual(
+            search.query_params,
+            {
+                "bundle": bundle.id,
+                "q": "search query",
+                "sort": BookmarkSearch.SORT_TITLE_DESC,
+            },
+        )
+
     def test_query_params(self):
         # no params
         search = BookmarkSearch()
@@ -181,6 +207,63 @@ class BookmarkSearchModelTest(TestCase, BookmarkFactoryMixin):
             },
         )
 
+    def test_query_params_with_bundle_date_filter(self):
+        bundle = self.setup_bundle()
+        bundle.search_params = {
+            "date_filter_by": BookmarkSearch.FILTER_DATE_BY_ADDED,
+            "date_filter_type": BookmarkSearch.FILTER_DATE_TYPE_ABSOLUTE,
+            "date_filter_start": "2024-01-01",
+            "date_filter_end": "2024-01-31",
+        }
+
+        # same dates as bundle
+        search = BookmarkSearch(
+            bundle=bundle,
+            date_filter_start=date(2024, 1, 1),
+            date_filter_end=date(2024, 1, 31),
+        )
+        self.assertEqual(search.query_params, {"bundle": bundle.id})
+
+        # different dates than bundle
+        search = BookmarkSearch(
+            bundle=bundle,
+            date_filter_start=date(2024, 2, 1),
+            date_filter_end=date(2024, 2, 29),
+        )
+        self.assertEqual(
+            search.query_params,
+            {
+                "bundle": bundle.id,
+                "date_filter_start": date(2024, 2, 1),
+                "date_filter_end": date(2024, 2, 29),
+            },
+        )
+
+        # relative dates are never query params
+        search = BookmarkSearch(
+            bundle=bundle,
+            date_filter_type=BookmarkSearch.FILTER_DATE_TYPE_RELATIVE,
+            date_filter_relative_string="today",
+        )
+        self.assertEqual(
+            search.query_params,
+            {
+                "bundle": bundle.id,
+                "date_filter_type": BookmarkSearch.FILTER_DATE_TYPE_RELATIVE,
+                "date_filter_relative_string": "today",
+            },
+        )
+
+    def test_bundle_search_object_parses_dates(self):
+        bundle = self.setup_bundle()
+        bundle.search_params = {
+            "date_filter_start": "2024-01-01",
+            "date_filter_end": "invalid",
+        }
+        search = bundle.search_object
+        self.assertEqual(search.__dict__["date_filter_start"], date(2024, 1, 1))
+        self.assertIs(bundle.search_object, search)
+
     def test_modified_params(self):
         # no params
         bookmark_search = BookmarkSearch()
@@ -320,3 +403,24 @@ class BookmarkSearchModelTest(TestCase, BookmarkFactoryMixin):
                 "date_filter_relative_string": None,
             },
         )
+
+    def test_parse_relative_date_string(self):
+        today = date(2024, 3, 13)
+        with mock.patch("bookmarks.models.date") as mock_date:
+            mock_date.today.return_value = today
+            parse = BookmarkSearch.parse_relative_date_string
+
+            self.assertEqual(parse("today"), (today, today))
+            self.assertEqual(parse("yesterday"), (date(2024, 3, 12), date(2024, 3, 12)))
+            self.assertEqual(parse("this_week"), (date(2024, 3, 11), date(2024, 3, 17)))
+            self.assertEqual(parse("this_month"), (date(2024, 3, 1), date(2024, 3, 31)))
+            self.assertEqual(parse("this_year"), (date(2024, 1, 1), date(2024, 12, 31)))
+            self.assertEqual(parse("last_3_days"), (date(2024, 3, 11), today))
+            self.assertEqual(parse("last_2_weeks"), (date(2024, 2, 29), today))
+            self.assertEqual(parse("last_1_month"), (date(2024, 2, 13), today))
+            self.assertEqual(parse("last_1_year"), (date(2023, 3, 15), today))
+            self.assertEqual(parse("invalid"), (None, None))
+
+            # result follows the current date
+            mock_date.today.return_value = date(2024, 3, 14)
+            self.assertEqual(parse("today"), (date(2024, 3, 14), date(2024, 3, 14)))
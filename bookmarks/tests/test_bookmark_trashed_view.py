@@ -0,0 +1,73 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+
+from bookmarks.models import BookmarkSearch, UserProfile
+from bookmarks.tests.helpers import BookmarkFactoryMixin
+
+
+class BookmarkTrashedViewTestCase(TestCase, BookmarkFactoryMixin):
+
+    def setUp(self) -> None:
+        user = self.get_or_create_test_user()
+        self.client.force_login(user)
+
+    def test_seeds_default_trash_search_preferences(self):
+        profile = self.get_or_create_test_user().profile
+        profile.trash_search_preferences = {}
+        profile.save()
+
+        response = self.client.get(reverse("linkding:bookmarks.trashed"))
+        self.assertEqual(response.status_code, 200)
+
+        profile.refresh_from_db()
+        self.assertEqual(
+            profile.trash_search_preferences,
+            {"sort": BookmarkSearch.SORT_DELETED_DESC},
+        )
+
+    def test_seeds_default_trash_search_preferences_only_once(self):
+        profile = self.get_or_create_test_user().profile
+        profile.trash_search_preferences = {}
+        profile.save()
+
+        with patch.object(
+            UserProfile, "save", autospec=True, side_effect=UserProfile.save
+        ) as mock_save:
+            self.client.get(reverse("linkding:bookmarks.trashed"))
+            self.client.get(reverse("linkding:bookmarks.trashed"))
+            self.client.post(reverse("linkding:bookmarks.trashed.action"))
+
+            mock_save.assert_called_once()
+            self.assertEqual(
+                mock_save.call_args.kwargs,
+                {"update_fields": ["trash_search_preferences"]},
+            )
+
+    def test_does_not_save_existing_trash_search_preferences(self):
+        profile = self.get_or_create_test_user().profile
+        profile.trash_search_preferences = {"sort": BookmarkSearch.SORT_DELETED_ASC}
+        profile.save()
+
+        with patch.object(UserProfile, "save", autospec=True) as mock_save:
+            self.client.get(reverse("linkding:bookmarks.trashed"))
+
+            mock_save.assert_not_called()
+
+    def test_seeds_default_trash_search_preferences_again_after_reset(self):
+        profile = self.get_or_create_test_user().profile
+        profile.trash_search_preferences = {}
+        profile.save()
+        self.client.get(reverse("linkding:bookmarks.trashed"))
+
+        profile.refresh_from_db()
+        profile.trash_search_preferences = {}
+        profile.save()
+        self.client.get(reverse("linkding:bookmarks.trashed"))
+
+        profile.refresh_from_db()
+        self.assertEqual(
+            profile.trash_search_preferences,
+            {"sort": BookmarkSearch.SORT_DELETED_DESC},
+        )
@@ -1,9 +1,12 @@
+from unittest import mock
+
 from django.test import TestCase
 
 from bookmarks.models import Bookmark
+from bookmarks.tests.helpers import BookmarkFactoryMixin
 
 
-class BookmarkTestCase(TestCase):
+class BookmarkTestCase(TestCase, BookmarkFactoryMixin):
 
     def test_bookmark_resolved_title(self):
         bookmark = Bookmark(
@@ -14,3 +17,57 @@ class BookmarkTestCase(TestCase):
 
         bookmark = Bookmark(title="", url="https://example.com")
         self.assertEqual(bookmark.resolved_title, "https://example.com")
+
+    def test_save_normalizes_url_only_when_changed(self):
+        bookmark = self.setup_bookmark(url="https://EXAMPLE.com/path/")
+        self.assertEqual(bookmark.url_normalized, "https://example.com/path")
+
+        bookmark = Bookmark.objects.get(id=bookmark.id)
+        with mock.patch("bookmarks.models.normalize_url") as mock_normalize_url:
+            bookmark.unread = True
+            bookmark.save()
+            mock_normalize_url.assert_not_called()
+
+        bookmark.url = "https://EXAMPLE.com/other/"
+        bookmark.save()
+        bookmark.refresh_from_db()
+        self.assertEqual(bookmark.url_normalized, "https://example.com/other")
+
+    def test_save_with_update_fields_skips_url_normalization(self):
+        bookmark = self.setup_bookmark(url="https://example.com")
+        bookmark = Bookmark.objects.get(id=bookmark.id)
+
+        with mock.patch("bookmarks.models.normalize_url") as mock_normalize_url:
+            bookmark.url_normalized = ""
+            bookmark.shared = True
+            bookmark.save(update_fields=["shared"])
+            mock_normalize_url.assert_not_called()
+
+    def test_tag_names_are_sorted_and_reset_when_tags_change(self):
+        tag_b = self.setup_tag(name="b-tag")
+        tag_a = self.setup_tag(name="a-tag")
+        bookmark = self.setup_bookmark(tags=[tag_b, tag_a])
+        bookmark = Bookmark.objects.get(id=bookmark.id)
+        self.assertEqual(bookmark.tag_names, ["a-tag", "b-tag"])
+
+        tag_c = self.setup_tag(name="c-tag")
+        bookmark.tags.add(tag_c)
+        self.assertEqual(bookmark.tag_names, ["a-tag", "b-tag", "c-tag"])
+
+        bookmark.tags.set([tag_c])
+        self.assertEqual(bookmark.tag_names, ["c-tag"])
+
+        bookmark = Bookmark.objects.prefetch_related("tags").get(id=bookmark.id)
+        self.assertEqual(bookmark.tag_names, ["c-tag"])
+
+    def test_tag_names_reflect_reverse_and_bulk_tag_changes(self):
+        tag_a = self.setup_tag(name="a-tag")
+        bookmark = self.setup_bookmark(tags=[tag_a])
+        self.assertEqual(bookmark.tag_names, ["a-tag"])
+
+        tag_b = self.setup_tag(name="b-tag")
+        tag_b.bookmark_set.add(bookmark)
+        self.assertEqual(bookmark.tag_names, ["a-tag", "b-tag"])
+
+        Bookmark.tags.through.objects.filter(bookmark=bookmark, tag=tag_a).delete()
+        self.assertEqual(bookmark.tag_names, ["b-tag"])
@@ -21,6 +21,9 @@ class MockStreamingResponse:
     def iter_content(self, **kwargs):
         return self.chunks
 
+    def raise_for_status(self):
+        pass
+
     def __enter__(self):
         return self
 
@@ -35,6 +38,7 @@ class FaviconLoaderTestCase(TestCase):
             LD_FAVICON_FOLDER=self.temp_favicon_folder.name
         )
         self.favicon_folder_override.enable()
+        favicon_loader._favicon_file_cache.clear()
 
     def tearDown(self) -> None:
         self.temp_favicon_folder.cleanup()
@@ -190,3 +194,40 @@ class FaviconLoaderTestCase(TestCase):
             favicon_loader.load_favicon("https://example.com")
 
             self.assertTrue(self.icon_exists("https_example_com.ico"))
+
+    def test_load_favicon_cached_skips_folder_scan_for_known_hosts(self):
+        with mock.patch("requests.get") as mock_get:
+            mock_get.return_value = self.create_mock_response()
+            favicon_file = favicon_loader.load_favicon_cached("https://example.com")
+            self.assertEqual("https_example_com.png", favicon_file)
+
+            with mock.patch(
+                "bookmarks.services.favicon_loader._check_existing_favicon"
+            ) as mock_check:
+                mock_get.reset_mock()
+                cached_file = favicon_loader.load_favicon_cached(
+                    "https://example.com/foo?bar"
+                )
+                self.assertEqual(favicon_file, cached_file)
+                mock_check.assert_not_called()
+                mock_get.assert_not_called()
+
+    def test_load_favicon_cached_reloads_missing_or_stale_icon(self):
+        with mock.patch("requests.get") as mock_get:
+            mock_get.return_value = self.create_mock_response()
+            favicon_loader.load_favicon_cached("https://example.com")
+
+            # stale icon is loaded again
+            icon_path = self.get_icon_path("https_example_com.png")
+            one_day_ago = time.time() - 60 * 60 * 24
+            os.utime(icon_path.absolute(), (one_day_ago, one_day_ago))
+            mock_get.reset_mock()
+            favicon_loader.load_favicon_cached("https://example.com")
+            mock_get.assert_called()
+
+            # deleted icon is loaded again
+            self.clear_favicon_folder()
+            mock_get.reset_mock()
+            favicon_loader.load_favicon_cached("https://example.com")
+            mock_get.assert_called()
+            self.assertTrue(self.icon_exists("https_example_com.png"))
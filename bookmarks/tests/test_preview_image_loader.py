@@ -203,3 +203,44 @@ class PreviewImageLoaderTestCase(TestCase):
 
             self.assertImageExists(file, mock_image_data)
             self.assertEqual("jpg", file.split(".")[-1])
+
+    def test_delete_expired_temporary_preview_images(self):
+        temp_folder = Path(settings.LD_PREVIEW_FOLDER) / "tmp"
+        temp_folder.mkdir(parents=True)
+        expired_file = temp_folder / "expired.png"
+        recent_file = temp_folder / "recent.png"
+        expired_file.write_bytes(mock_image_data)
+        recent_file.write_bytes(mock_image_data)
+        expired_mtime = expired_file.stat().st_mtime - 601
+        os.utime(expired_file, (expired_mtime, expired_mtime))
+
+        deleted = preview_image_loader.delete_expired_temporary_preview_images()
+
+        self.assertEqual(1, deleted)
+        self.assertFalse(expired_file.exists())
+        self.assertTrue(recent_file.exists())
+
+    def test_delete_expired_temporary_preview_images_without_temp_folder(self):
+        self.assertEqual(
+            0, preview_image_loader.delete_expired_temporary_preview_images()
+        )
+
+    def test_load_temporary_preview_image_refreshes_reused_file(self):
+        image_url = "https://example.com/image.png"
+        temp_folder = Path(settings.LD_PREVIEW_FOLDER) / "tmp"
+        temp_folder.mkdir(parents=True)
+        temp_file = temp_folder / (
+            preview_image_loader._url_to_filename(image_url) + ".png"
+        )
+        temp_file.write_bytes(mock_image_data)
+        old_mtime = temp_file.stat().st_mtime - 601
+        os.utime(temp_file, (old_mtime, old_mtime))
+
+        with mock.patch("requests.get") as mock_get:
+            preview_image_loader.load_temporary_preview_image(image_url)
+            mock_get.assert_not_called()
+
+        self.assertGreater(temp_file.stat().st_mtime, old_mtime + 600)
+        self.assertEqual(
+            0, preview_image_loader.delete_expired_temporary_preview_images()
+        )
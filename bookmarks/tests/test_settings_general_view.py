@@ -239,14 +239,18 @@ class SettingsGeneralViewTestCase(TestCase, BookmarkFactoryMixin):
         self.client.post(reverse("linkding:settings.update"), form_data, follow=True)
         self.user.profile.refresh_from_db()
 
-        expected_hash = hashlib.md5(form_data["custom_css"].encode("utf-8")).hexdigest()
+        expected_hash = hashlib.blake2b(
+            form_data["custom_css"].encode("utf-8"), digest_size=16
+        ).hexdigest()
         self.assertEqual(expected_hash, self.user.profile.custom_css_hash)
 
         form_data["custom_css"] = "body { background-color: #fff; }"
         self.client.post(reverse("linkding:settings.update"), form_data, follow=True)
         self.user.profile.refresh_from_db()
 
-        expected_hash = hashlib.md5(form_data["custom_css"].encode("utf-8")).hexdigest()
+        expected_hash = hashlib.blake2b(
+            form_data["custom_css"].encode("utf-8"), digest_size=16
+        ).hexdigest()
         self.assertEqual(expected_hash, self.user.profile.custom_css_hash)
 
         form_data["custom_css"] = ""
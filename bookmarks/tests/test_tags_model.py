@@ -51,3 +51,7 @@ class TagTestCase(TestCase):
             parse_tag_string("travel guide, book recommendations"),
             ["travel-guide", "book-recommendations"],
         )
+        self.assertCountEqual(
+            parse_tag_string("travel\tguide, book\xa0recommendations"),
+            ["travel-guide", "book-recommendations"],
+        )
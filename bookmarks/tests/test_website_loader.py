@@ -1,3 +1,4 @@
+import threading
 from unittest import mock
 from bookmarks.services import website_loader
 
@@ -27,7 +28,7 @@ class MockStreamingResponse:
 class WebsiteLoaderTestCase(TestCase):
     def setUp(self):
         # clear cached metadata before test run
-        website_loader._load_website_metadata_cached.cache_clear()
+        website_loader._metadata_cache.clear()
 
     def render_html_document(
         self, title, description="", og_description="", og_image=""
@@ -57,8 +58,21 @@ class WebsiteLoaderTestCase(TestCase):
         </html>
         """
 
+    def test_uses_one_session_per_thread(self):
+        session = website_loader._get_session()
+        self.assertIs(session, website_loader._get_session())
+
+        other_sessions = []
+        thread = threading.Thread(
+            target=lambda: other_sessions.append(website_loader._get_session())
+        )
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(session, other_sessions[0])
+
     def test_load_page_returns_content(self):
-        with mock.patch("requests.get") as mock_get:
+        with mock.patch("requests.Session.get") as mock_get:
             mock_get.return_value = MockStreamingResponse(
                 num_chunks=10, chunk_size=1024
             )
@@ -68,7 +82,7 @@ class WebsiteLoaderTestCase(TestCase):
             self.assertEqual(expected_content_size, len(content))
 
     def test_load_page_limits_large_documents(self):
-        with mock.patch("requests.get") as mock_get:
+        with mock.patch("requests.Session.get") as mock_get:
             mock_get.return_value = MockStreamingResponse(
                 num_chunks=10, chunk_size=1024 * 1000
             )
@@ -79,7 +93,7 @@ class WebsiteLoaderTestCase(TestCase):
             self.assertEqual(expected_content_size, len(content))
 
     def test_load_page_stops_reading_at_end_of_head(self):
-        with mock.patch("requests.get") as mock_get:
+        with mock.patch("requests.Session.get") as mock_get:
             mock_get.return_value = MockStreamingResponse(
                 num_chunks=10, chunk_size=1024 * 1000, insert_head_after_chunk=0
             )
@@ -90,7 +104,7 @@ class WebsiteLoaderTestCase(TestCase):
             self.assertEqual(expected_content_size, len(content))
 
     def test_load_page_removes_bytes_after_end_of_head(self):
-        with mock.patch("requests.get") as mock_get:
+        with mock.patch("requests.Session.get") as mock_get:
             mock_response = MockStreamingResponse(num_chunks=1, chunk_size=0)
             mock_response.chunks[0] = "<head>人</head>".encode("utf-8")
             # add a single byte that can't be decoded to utf-8
@@ -200,3 +214,165 @@ class WebsiteLoaderTestCase(TestCase):
                 "https://example.com", ignore_cache=True
             )
             self.assertEqual(mock_load_page.call_count, 2)
+
+    def test_website_metadata_cache_expires(self):
+        html = "<html><head><title>Test Title</title></head></html>"
+
+        with mock.patch.object(
+            website_loader, "load_page", return_value=html
+        ) as mock_load_page, mock.patch(
+            "bookmarks.services.website_loader.time.monotonic", return_value=1000.0
+        ) as mock_monotonic:
+            website_loader.load_website_metadata("https://example.com")
+            website_loader.load_website_metadata("https://example.com")
+            mock_load_page.assert_called_once()
+
+            mock_monotonic.return_value = 1000.0 + website_loader.METADATA_CACHE_TTL
+            website_loader.load_website_metadata("https://example.com")
+            self.assertEqual(mock_load_page.call_count, 2)
+
+    def test_website_metadata_cache_is_thread_safe(self):
+        def load_page(url, config=None):
+            return f"<html><head><title>{url}</title></head></html>"
+
+        errors = []
+
+        def load_urls(offset):
+            try:
+                for index in range(200):
+                    url = f"https://example.com/{(offset + index) % 50}"
+                    metadata = website_loader.load_website_metadata(url)
+                    self.assertEqual(url, metadata.title)
+            except Exception as e:
+                errors.append(e)
+
+        with mock.patch.object(
+            website_loader, "load_page", side_effect=load_page
+        ), mock.patch.object(website_loader, "METADATA_CACHE_SIZE", 8):
+            threads = [
+                threading.Thread(target=load_urls, args=(offset,))
+                for offset in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual([], errors)
+        self.assertLessEqual(len(website_loader._metadata_cache), 8)
+
+    def test_load_website_metadata_uses_og_title_and_preload_image_as_fallback(self):
+        html = """
+        <html><head>
+            <meta property="og:title" content=" og title ">
+            <link rel="preload" as="image" href="/preload.jpg">
+        </head><body><title>body title</title></body></html>
+        """
+        with mock.patch.object(website_loader, "load_page", return_value=html):
+            metadata = website_loader.load_website_metadata("https://example.com/a")
+            self.assertEqual("og title", metadata.title)
+            self.assertEqual("https://example.com/preload.jpg", metadata.preview_image)
+
+    def test_website_metadata_cache_with_custom_config(self):
+        html = "<html><head><title>Test Title</title></head></html>"
+
+        with mock.patch.object(
+            website_loader, "load_page", return_value=html
+        ) as mock_load_page, mock.patch.object(
+            website_loader, "search_config_for_domain", return_value={"timeout": 5}
+        ) as mock_search_config:
+            website_loader.load_website_metadata("https://example.com")
+            website_loader.load_website_metadata("https://example.com")
+            mock_load_page.assert_called_once_with(
+                "https://example.com", {"timeout": 5}
+            )
+
+            # changed config should not use cached metadata
+            mock_search_config.return_value = {"timeout": 20}
+            metadata = website_loader.load_website_metadata("https://example.com")
+            self.assertEqual(mock_load_page.call_count, 2)
+            self.assertEqual("Test Title", metadata.title)
+
+    def test_load_page_detects_non_utf8_encoding(self):
+        with mock.patch("requests.Session.get") as mock_get:
+            html = '<html><head><meta charset="gbk"><title>中文标题测试网页内容，这是一个比较长的标题用于测试</title></head>'
+            mock_response = MockStreamingResponse(num_chunks=1, chunk_size=0)
+            mock_response.chunks[0] = html.encode("gb18030")
+            mock_get.return_value = mock_response
+            content = website_loader.load_page("https://example.com")
+
+            self.assertEqual(html, content)
+
+    def test_load_page_detects_uncommon_single_byte_encoding(self):
+        with mock.patch("requests.Session.get") as mock_get:
+            html = "<html><head><title>Привет мир, это тестовая страница на русском языке</title></head>"
+            mock_response = MockStreamingResponse(num_chunks=1, chunk_size=0)
+            mock_response.chunks[0] = html.encode("koi8_r")
+            mock_get.return_value = mock_response
+            content = website_loader.load_page("https://example.com")
+
+            self.assertEqual(html, content)
+
+    def test_build_request_cookies(self):
+        config = {
+            "headers": {"Cookie": "session=abc; theme=dark;token=a=b; invalid; =x"}
+        }
+        cookies = website_loader.build_request_cookies(config)
+        self.assertEqual({"session": "abc", "theme": "dark", "token": "a=b"}, cookies)
+
+        config = {"headers": {"Cookie": 'quoted="a b"; empty=""; partial="x'}}
+        cookies = website_loader.build_request_cookies(config)
+        self.assertEqual({"quoted": "a b", "empty": "", "partial": '"x'}, cookies)
+
+        self.assertEqual({}, website_loader.build_request_cookies(None))
+        self.assertEqual({}, website_loader.build_request_cookies({"headers": {}}))
+
+    def test_build_request_headers(self):
+        headers = website_loader.build_request_headers()
+        self.assertEqual("1", headers["Dnt"])
+        self.assertIs(headers, website_loader.build_request_headers(None))
+
+        config = {"headers": {"Referer": "https://example.com", "Cookie": "a=b"}}
+        custom_headers = website_loader.build_request_headers(config)
+        self.assertEqual("https://example.com", custom_headers["Referer"])
+        self.assertNotIn("Cookie", custom_headers)
+        self.assertNotIn("Referer", website_loader.build_request_headers())
+
+    def test_fast_head_extraction_skips_script_noscript_and_template(self):
+        blocks = [
+            "<!-- <title>comment</title> -->",
+            "<script>var meta = '<meta name=description content=x>';</script>",
+            '<NOSCRIPT><meta property="og:image" content="/x.jpg"></NOSCRIPT>',
+            '<template><meta name="description" content="x"></template>',
+        ]
+        for block in blocks:
+            with self.subTest(block=block):
+                html = f"<html><head><title>Title</title>{block}</head></html>"
+                self.assertIsNone(website_loader._extract_head_metadata_fast(html))
+
+    def test_load_website_metadata_handles_attribute_order_and_entities(self):
+        html = """
+        <html><head>
+            <title>Tom &amp; Jerry</title>
+            <meta content="It&#39;s a description" name='description'>
+            <meta content=/image.jpg property=og:image>
+        </head></html>
+        """
+        with mock.patch.object(website_loader, "load_page", return_value=html):
+            metadata = website_loader.load_website_metadata("https://example.com")
+            self.assertEqual("Tom & Jerry", metadata.title)
+            self.assertEqual("It's a description", metadata.description)
+            self.assertEqual("https://example.com/image.jpg", metadata.preview_image)
+
+    def test_load_website_metadata_ignores_commented_out_tags(self):
+        html = """
+        <html><head>
+            <title>Test Title</title>
+            <!-- <meta name="description" content="commented out"> -->
+            <meta name="description" content="a > b">
+        </head></html>
+        """
+        with mock.patch.object(website_loader, "load_page", return_value=html):
+            metadata = website_loader.load_website_metadata("https://example.com")
+            self.assertEqual("Test Title", metadata.title)
+            self.assertEqual("a > b", metadata.description)
@@ -1,15 +1,18 @@
+import calendar
 import importlib
 import json
 import logging
 import os
 import re
+import time
 import unicodedata
 import urllib.parse
 import datetime
+from types import MappingProxyType
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 
-from dateutil.relativedelta import relativedelta
 from django.http import HttpResponseRedirect
 from django.template.defaultfilters import pluralize
 from django.utils import timezone, formats
@@ -38,18 +41,34 @@ weekday_names = {
 }
 
 
+_ONE_DAY = datetime.timedelta(days=1)
+
+
+def _full_months_between(value: datetime.datetime, now: datetime.datetime) -> int:
+    # 两个时间之间的完整月数，与 relativedelta(now, value) 的 years * 12 + months 一致
+    months = (now.year - value.year) * 12 + now.month - value.month
+    if months > 0:
+        # value 加上 months 个月后落在 now 所在的月份，日期超出该月天数时取月末
+        day = value.day
+        if day > 28:
+            day = min(day, calendar.monthrange(now.year, now.month)[1])
+        if (day, value.time()) > (now.day, now.time()):
+            months -= 1
+    return months
+
+
 def humanize_absolute_date(
     value: datetime.datetime, now: Optional[datetime.datetime] = None
 ):
     if not now:
         now = timezone.now()
     # Convert to local time zone first
-    value_local = timezone.localtime(value)
-    now_local = timezone.localtime(now)
-    delta = relativedelta(now_local, value_local)
-    yesterday = now_local - relativedelta(days=1)
+    current_timezone = timezone.get_current_timezone()
+    value_local = timezone.localtime(value, current_timezone)
+    now_local = timezone.localtime(now, current_timezone)
+    yesterday = now_local - _ONE_DAY
 
-    is_older_than_a_week = delta.years > 0 or delta.months > 0 or delta.weeks > 0 or delta.days > 0
+    is_older_than_a_week = now_local - value_local >= _ONE_DAY
 
     if is_older_than_a_week:
         return formats.date_format(value_local, "SHORT_DATE_FORMAT")
@@ -67,24 +86,26 @@ def humanize_relative_date(
     if not now:
         now = timezone.now()
     # Convert to local time zone first
-    value_local = timezone.localtime(value)
-    now_local = timezone.localtime(now)
-    delta = relativedelta(now_local, value_local)
-    is_current_week = value_local.isocalendar()[:2] == now_local.isocalendar()[:2]
-
-    if delta.years > 0:
-        return f"{delta.years} 年前"
-    elif delta.months > 0:
-        return f"{delta.months} 月前"
-    elif delta.weeks > 0:
-        return f"{delta.weeks} 周前"
+    current_timezone = timezone.get_current_timezone()
+    value_local = timezone.localtime(value, current_timezone)
+    now_local = timezone.localtime(now, current_timezone)
+    months = _full_months_between(value_local, now_local)
+
+    if months >= 12:
+        return f"{months // 12} 年前"
+    elif months > 0:
+        return f"{months} 月前"
+
+    weeks = (now_local - value_local).days // 7
+    if weeks > 0:
+        return f"{weeks} 周前"
     else:
-        yesterday = now_local - relativedelta(days=1)
+        yesterday = now_local - _ONE_DAY
         if value_local.day == now_local.day:
             return "今天"
         elif value_local.day == yesterday.day:
             return "昨天"
-        elif is_current_week:
+        elif value_local.isocalendar()[:2] == now_local.isocalendar()[:2]:
             return weekday_names[value_local.isoweekday()]
         else:
             return "上" + weekday_names[value_local.isoweekday()]
@@ -94,12 +115,12 @@ def humanize_absolute_date_short(
 ):
     if not now:
         now = timezone.now()
-    value_local = timezone.localtime(value)
-    now_local = timezone.localtime(now)
-    delta = relativedelta(now_local, value_local)
-    yesterday = now_local - relativedelta(days=1)
+    current_timezone = timezone.get_current_timezone()
+    value_local = timezone.localtime(value, current_timezone)
+    now_local = timezone.localtime(now, current_timezone)
+    yesterday = now_local - _ONE_DAY
 
-    is_older_than_yesterday = delta.years > 0 or delta.months > 0 or delta.weeks > 0 or delta.days > 0
+    is_older_than_yesterday = now_local - value_local >= _ONE_DAY
 
     if is_older_than_yesterday:
         if value_local.year == now_local.year:
@@ -149,24 +170,55 @@ def parse_timestamp(value: str):
 
 def get_clean_url(url: str) -> str:
     # 清除 url 中所有参数
-    parsed_url = urllib.parse.urlparse(url)
-    clean_url = urllib.parse.urlunparse((
+    # urlsplit 不解析 ;params，比 urlparse 少一步处理，params 在下面单独去除
+    parsed_url = urllib.parse.urlsplit(url)
+    path = parsed_url.path
+    if ";" in path and parsed_url.scheme in urllib.parse.uses_params:
+        # 与 urlparse 相同，params 只存在于最后一段路径中
+        index = path.find(";", max(path.rfind("/"), 0))
+        if index != -1:
+            path = path[:index]  # 清空 params
+    clean_url = urllib.parse.urlunsplit((
         parsed_url.scheme, 
         parsed_url.netloc, 
-        parsed_url.path, 
-        '',  # 清空 params
+        path, 
         '',  # 清空 query (? 后的部分)
         ''   # 清空 fragment (# 后的部分)
     ))
     return clean_url
 
+_SAFE_RETURN_URL_RE = re.compile(r"^/[a-z]+")
+
+
 def get_safe_return_url(return_url: str, fallback_url: str):
     # Use fallback if URL is none or URL is not on same domain
-    if not return_url or not re.match(r"^/[a-z]+", return_url):
+    if not return_url or not _SAFE_RETURN_URL_RE.match(return_url):
         return fallback_url
     return return_url
 
 
+# quote_plus不会转义的字符，只包含这些字符的值可以原样拼接
+_URL_SAFE_VALUE_RE = re.compile(r"[A-Za-z0-9_.~-]*")
+
+
+def _quote_query_value(value) -> str:
+    value = value if isinstance(value, str) else str(value)
+    if _URL_SAFE_VALUE_RE.fullmatch(value):
+        return value
+    return urllib.parse.quote_plus(value)
+
+
+def urlencode_params(params: dict) -> str:
+    """
+    Same output as urllib.parse.urlencode for a flat dict, but only quotes values
+    that actually contain unsafe characters (sort keys, ids, dates usually don't).
+    """
+    return "&".join(
+        f"{_quote_query_value(key)}={_quote_query_value(value)}"
+        for key, value in params.items()
+    )
+
+
 def redirect_with_query(request, redirect_url):
     query_string = urllib.parse.urlencode(request.GET)
     if query_string:
@@ -188,27 +240,44 @@ def generate_username(email, claims):
 
 
 def get_domain(url: str) -> str:
-    return urllib.parse.urlparse(url).netloc
-
-def search_config_for_domain(url, settings_path, settings_cache=None):
+    # 快速路径：常见的 scheme://netloc/... 形式直接切片，不做完整的 URL 解析
+    scheme_end = url.find("://")
+    scheme = url[:scheme_end]
+    if scheme_end > 0 and scheme.isascii() and scheme.isalpha():
+        start = scheme_end + 3
+        end = len(url)
+        for delimiter in "/?#":
+            index = url.find(delimiter, start, end)
+            if index != -1:
+                end = index
+        netloc = url[start:end]
+        # 包含特殊字符时交给 urllib 处理（去除制表/换行符、IPv6 校验等）
+        if netloc.isascii() and netloc.isprintable() and "[" not in netloc and "]" not in netloc:
+            return netloc
+    return urllib.parse.urlsplit(url).netloc
+
+def search_config_for_domain(url, settings_path):
+    # 返回缓存中的只读配置，调用方（包括自定义加载器）不能修改
     config = None
 
-    if os.path.exists(settings_path):
-        domain_map = load_settings(settings_path,settings_cache)
-        if domain_map == '__JSON_ERROR__':
-            logging.error(f"【错误】配置文件解析失败：{settings.path}")
-            return config
-    else:
-        logging.error(f"【错误】配置文件路径不存在：{settings.path}")
+    domain_map, wildcard_map = _load_settings_with_wildcards(settings_path)
+    if domain_map is None:
+        logging.error(f"【错误】配置文件路径不存在：{settings_path}")
+        return config
+    if domain_map == '__JSON_ERROR__':
+        logging.error(f"【错误】配置文件解析失败：{settings_path}")
         return config
 
     domain = get_domain(url)
     if domain in domain_map: # 直接命中
         config = domain_map[domain]
-    if not config:
-        for key in domain_map: # 解析命中（通用匹配符*）
-            if key.startswith("*.") and domain.endswith(key[1:]):
-                config =  domain_map[key]
+    if not config and wildcard_map: # 解析命中（通用匹配符*），优先匹配最长的后缀
+        index = domain.find(".")
+        while index != -1:
+            config = wildcard_map.get(domain[index:])
+            if config:
+                break
+            index = domain.find(".", index + 1)
 
     # 域名别名（配置复用）：将另一个域名的配置作为当前域名的配置
     visited = {domain}
@@ -221,66 +290,98 @@ def search_config_for_domain(url, settings_path, settings_cache=None):
 
     return config
 
-def load_settings(path, cache):
+# 配置文件的修改时间最多每隔 N 秒检查一次，避免每次加载书签都产生 stat 调用
+SETTINGS_STAT_INTERVAL = 2
+
+def load_settings(path):
+    # 解析结果被缓存并在多次调用间共享，返回的是只读视图（dict 为
+    # MappingProxyType，list 为 tuple），调用方不能修改；需要修改时请自行复制
+    return _load_settings_with_wildcards(path)[0]
+
+def _load_settings_with_wildcards(path):
+    time_bucket = int(time.monotonic()) // SETTINGS_STAT_INTERVAL
+    mtime = _get_settings_mtime(path, time_bucket)
+    if mtime is None:
+        return None, None
+    return _load_settings_file(path, mtime)
+
+@lru_cache(maxsize=8)
+def _get_settings_mtime(path, time_bucket):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+@lru_cache(maxsize=8)
+def _load_settings_file(path, mtime):
     base_dir = Path(path).resolve().parent
-    cache = {} if cache is None else cache
     try:
-        mtime = os.path.getmtime(path)
-    except (OSError, FileNotFoundError):
-        cache["cache"] = None
-        cache["mtime"] = None
-        return cache["cache"]
-    cache_settings = cache.get("cache")
-    cache_mtime = cache.get("mtime")
-    if cache_settings is None or cache_mtime != mtime:
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
-                cache["cache"] = _process_path(config_data, base_dir)
-            cache["mtime"] = mtime
-        except json.JSONDecodeError:
-            cache["cache"] = "__JSON_ERROR__"
-            cache["mtime"] = mtime
-        except (OSError, FileNotFoundError):
-            cache["cache"] = None
-            cache["mtime"] = None
-    return cache.get("cache")
+        with open(path, "r", encoding="utf-8") as f:
+            config_data = json.load(f)
+        domain_map = _process_path(config_data, base_dir)
+    except json.JSONDecodeError:
+        return "__JSON_ERROR__", None
+    except OSError:
+        return None, None
+
+    # 预先建立通配规则索引：{".example.com": config}，查找时只需按域名后缀查字典
+    wildcard_map = {
+        key[1:]: value
+        for key, value in domain_map.items()
+        if key.startswith("*.") and value
+    } if isinstance(domain_map, MappingProxyType) else {}
+    return domain_map, wildcard_map
 
 def _process_path(node, base_dir):
-    '''解析相对路径'''
+    '''解析相对路径，返回新的只读对象而不修改传入的数据'''
     if isinstance(node, dict):
-        for key, value in node.items():
-            node[key] = _process_path(value, base_dir)
+        return MappingProxyType(
+            {key: _process_path(value, base_dir) for key, value in node.items()}
+        )
     elif isinstance(node, list):
-        for i, item in enumerate(node):
-            node[i] = _process_path(item, base_dir)
+        return tuple(_process_path(item, base_dir) for item in node)
     elif isinstance(node, str) and (node.startswith('./') or node.startswith('../')):
         # 如果是字符串且以 ./ 或 ../ 开头，就解析它
-        # (base_dir / node) 将路径拼接起来
-        # .resolve() 将其转换为绝对路径，并处理 ".." 等情况
-        return str((base_dir / node).resolve())
-    
+        return _resolve_path(base_dir, node)
+
     return node
 
+@lru_cache(maxsize=1024)
+def _resolve_path(base_dir, node):
+    # (base_dir / node) 将路径拼接起来
+    # .resolve() 将其转换为绝对路径，并处理 ".." 等情况
+    return str((base_dir / node).resolve())
+
 def load_module(path, cache):
     cache = {} if cache is None else cache
+    # 使用真实路径作为缓存键，指向同一文件的不同路径共享同一个模块
+    path = os.path.realpath(path)
+    now = time.monotonic()
+    entry = cache.get(path)
+    # 与配置文件相同，修改时间最多每隔 SETTINGS_STAT_INTERVAL 秒检查一次
+    if entry is not None and now - entry[2] < SETTINGS_STAT_INTERVAL:
+        return entry[0]
     try:
         mtime = os.path.getmtime(path)
     except (OSError, FileNotFoundError):
         return None
-    spec = cache.get(path)
-    if spec is None or spec[1] != mtime:
+    if entry is None or entry[1] != mtime:
         spec = importlib.util.spec_from_file_location("custom_module", path)
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
-        cache[path] = (module, mtime)
-    return cache[path][0]
+        entry = (module, mtime, now)
+    else:
+        entry = (entry[0], mtime, now)
+    cache[path] = entry
+    return entry[0]
+
+_RELATIVE_DATE_RE = re.compile(r'^last_(\d+)_(day|week|month|year)s?$')
 
 def parse_relative_date_string(date_filter_relative_string):
     '''解析相对日期字符串，获取数值、单位，用于前端搜索筛选项显示'''
     if not date_filter_relative_string:
         return None, None
-    match = re.match(r'^last_(\d+)_(day|week|month|year)s?$', date_filter_relative_string)
+    match = _RELATIVE_DATE_RE.match(date_filter_relative_string)
     if match:
         value = match.group(1)
         unit = match.group(2) + 's'
@@ -295,6 +396,10 @@ def normalize_url(url: str) -> str:
     if not url:
         return ""
 
+    # 绝大多数书签的地址已经是规范形式，可以跳过完整的解析与重组
+    if _is_normalized_url(url):
+        return url
+
     try:
         parsed = urllib.parse.urlparse(url)
 
@@ -331,3 +436,56 @@ def normalize_url(url: str) -> str:
 
     except (ValueError, AttributeError):
         return url
+
+
+def _is_normalized_url(url: str) -> bool:
+    """
+    判断地址是否已经是 normalize_url 的输出形式：小写的 scheme 和域名，
+    不含认证信息、端口与查询参数，路径不以 / 结尾
+    """
+    scheme_end = url.find("://")
+    if scheme_end <= 0:
+        return False
+    scheme = url[:scheme_end]
+    if not (scheme.isascii() and scheme.isalpha() and scheme.islower()):
+        return False
+    start = scheme_end + 3
+    end = url.find("/", start)
+    if end == -1:
+        end = len(url)
+    netloc = url[start:end]
+    path = url[end:]
+    return (
+        netloc != ""
+        and netloc.isascii()
+        and netloc.isprintable()
+        and netloc == netloc.lower()
+        and not any(char in netloc for char in "@:[]?#;")
+        and path.isprintable()
+        and not any(char in path for char in "?#;")
+        and not path.endswith("/")
+    )
+
+
+
+def delete_expired_files(folder, max_age: int) -> int:
+    """
+    删除目录中修改时间早于 max_age 秒之前的文件，返回删除的文件数
+    """
+    folder = Path(folder)
+    if not folder.is_dir():
+        return 0
+
+    # 按修改时间判断，一次扫描删除所有过期的文件
+    expires_before = time.time() - max_age
+    deleted = 0
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < expires_before:
+                    os.remove(entry.path)
+                    deleted += 1
+            except FileNotFoundError:
+                # 可能已被其他进程移动或删除
+                continue
+    return deleted
@@ -4,9 +4,28 @@ from bookmarks.models import Bookmark, BookmarkAsset, BookmarkBundle, Toast
 from bookmarks.type_defs import HttpRequest
 
 
-def bookmark_read(request: HttpRequest, bookmark_id: int | str):
+def _bookmark_query_set(select_related: tuple, prefetch_related: tuple):
+    query_set = Bookmark.objects.all()
+    # select_related() without arguments would follow all foreign keys
+    if select_related:
+        query_set = query_set.select_related(*select_related)
+    if prefetch_related:
+        query_set = query_set.prefetch_related(*prefetch_related)
+    return query_set
+
+
+def bookmark_read(
+    request: HttpRequest,
+    bookmark_id: int | str,
+    *,
+    # the access check below always needs the owner and its profile
+    select_related: tuple = ("owner__profile",),
+    prefetch_related: tuple = (),
+):
     try:
-        bookmark = Bookmark.objects.get(pk=int(bookmark_id))
+        bookmark = _bookmark_query_set(select_related, prefetch_related).get(
+            pk=int(bookmark_id)
+        )
     except Bookmark.DoesNotExist:
         raise Http404("Bookmark does not exist")
 
@@ -25,9 +44,17 @@ def bookmark_read(request: HttpRequest, bookmark_id: int | str):
     return bookmark
 
 
-def bookmark_write(request: HttpRequest, bookmark_id: int | str):
+def bookmark_write(
+    request: HttpRequest,
+    bookmark_id: int | str,
+    *,
+    select_related: tuple = (),
+    prefetch_related: tuple = (),
+):
     try:
-        return Bookmark.objects.get(pk=bookmark_id, owner=request.user)
+        return _bookmark_query_set(select_related, prefetch_related).get(
+            pk=bookmark_id, owner=request.user
+        )
     except Bookmark.DoesNotExist:
         raise Http404("Bookmark does not exist")
 
@@ -1,18 +1,23 @@
-import urllib.parse
+import operator
 import time
 import os
+from functools import lru_cache
 
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
+from django.db import transaction
 from django.db.models import QuerySet
 from django.http import (
+    HttpResponse,
     JsonResponse,
     HttpResponseRedirect,
     HttpResponseBadRequest,
     HttpResponseForbidden,
 )
-from django.shortcuts import render
-from django.urls import reverse
+from django.template import loader
+from django.urls import get_script_prefix, get_urlconf, reverse
+from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
 
 from bookmarks import queries, utils
 from bookmarks.forms import BookmarkForm
@@ -20,7 +25,7 @@ from bookmarks.models import (
     Bookmark,
     BookmarkSearch,
 )
-from bookmarks.services import assets as asset_actions, tasks, website_loader, preview_image_loader, favicon_loader
+from bookmarks.services import assets as asset_actions, tasks, preview_image_loader, favicon_loader, reader
 from bookmarks.services.bookmarks import (
     archive_bookmark,
     archive_bookmarks,
@@ -46,6 +51,18 @@ from bookmarks.utils import get_safe_return_url
 from bookmarks.views import access, contexts, partials, turbo
 
 
+@lru_cache(maxsize=None)
+def _cached_reverse(view_name: str, urlconf, script_prefix: str) -> str:
+    return reverse(view_name, urlconf=urlconf)
+
+
+def _reverse(view_name: str) -> str:
+    # 视图中反复使用的固定URL，缓存reverse的结果
+    # 结果取决于urlconf和脚本前缀，一并作为缓存键
+    urlconf = get_urlconf() or settings.ROOT_URLCONF
+    return _cached_reverse(view_name, urlconf, get_script_prefix())
+
+
 @login_required
 def index(request: HttpRequest):
     if request.method == "POST":
@@ -54,7 +71,10 @@ def index(request: HttpRequest):
     search = BookmarkSearch.from_request(
         request, request.GET, request.user_profile.search_preferences
     )
-    create_bundle_query_string = _get_create_bundle_query_string(search)
+    # 只在模板实际用到时才生成
+    create_bundle_query_string = SimpleLazyObject(
+        lambda: _get_create_bundle_query_string(search)
+    )
     bookmark_list = contexts.ActiveBookmarkListContext(request, search)
     bundles = contexts.BundlesContext(request)
     tag_cloud = contexts.ActiveTagCloudContext(request, search)
@@ -84,7 +104,10 @@ def archived(request: HttpRequest):
     search = BookmarkSearch.from_request(
         request, request.GET, request.user_profile.search_preferences
     )
-    create_bundle_query_string = _get_create_bundle_query_string(search)
+    # 只在模板实际用到时才生成
+    create_bundle_query_string = SimpleLazyObject(
+        lambda: _get_create_bundle_query_string(search)
+    )
     bookmark_list = contexts.ArchivedBookmarkListContext(request, search)
     bundles = contexts.BundlesContext(request)
     tag_cloud = contexts.ArchivedTagCloudContext(request, search)
@@ -113,7 +136,10 @@ def shared(request: HttpRequest):
     search = BookmarkSearch.from_request(
         request, request.GET, request.user_profile.search_preferences
     )
-    create_bundle_query_string = _get_create_bundle_query_string(search)
+    # 只在模板实际用到时才生成
+    create_bundle_query_string = SimpleLazyObject(
+        lambda: _get_create_bundle_query_string(search)
+    )
     bookmark_list = contexts.SharedBookmarkListContext(request, search)
     tag_cloud = contexts.SharedTagCloudContext(request, search)
     bookmark_details = contexts.get_details_context(
@@ -132,25 +158,34 @@ def shared(request: HttpRequest):
             "tag_cloud": tag_cloud,
             "details": bookmark_details,
             "users": users,
-            "rss_feed_url": reverse("linkding:feeds.public_shared"),
+            "rss_feed_url": _reverse("linkding:feeds.public_shared"),
             "create_bundle_query_string": create_bundle_query_string,
         },
     )
 
+def _ensure_trash_search_preferences(request: HttpRequest):
+    # 如果用户的回收站搜索偏好为空，设置默认的删除时间降序
+    # 只更新这一列，写入后偏好不再为空，之后的请求不会重复写入
+    profile = request.user_profile
+    if not profile.trash_search_preferences:
+        profile.trash_search_preferences = {"sort": BookmarkSearch.SORT_DELETED_DESC}
+        profile.save(update_fields=["trash_search_preferences"])
+
+
 @login_required
 def trashed(request: HttpRequest):
     if request.method == "POST":
         return search_action(request)
 
-    # 如果用户的回收站搜索偏好为空，设置默认的删除时间降序
-    if not request.user_profile.trash_search_preferences:
-        request.user_profile.trash_search_preferences = {"sort": BookmarkSearch.SORT_DELETED_DESC}
-        request.user_profile.save()
+    _ensure_trash_search_preferences(request)
 
     search = BookmarkSearch.from_request(
         request, request.GET, request.user_profile.trash_search_preferences
     )
-    create_bundle_query_string = _get_create_bundle_query_string(search)
+    # 只在模板实际用到时才生成
+    create_bundle_query_string = SimpleLazyObject(
+        lambda: _get_create_bundle_query_string(search)
+    )
     bookmark_list = contexts.TrashedBookmarkListContext(request, search)
     bundles = contexts.BundlesContext(request)
     tag_cloud = contexts.TrashedTagCloudContext(request, search)
@@ -172,75 +207,98 @@ def trashed(request: HttpRequest):
     )
 
 
+@lru_cache(maxsize=None)
+def _get_cached_template(template_name: str):
+    return loader.get_template(template_name)
+
+
+def _render(request: HttpRequest, template_name: str, context: dict = None, status: int = None):
+    # 缓存模板对象，跳过每次请求的模板查找；DEBUG模式下保留模板的自动重载
+    if settings.DEBUG:
+        template = loader.get_template(template_name)
+    else:
+        template = _get_cached_template(template_name)
+    return HttpResponse(template.render(context, request), status=status)
+
+
 def render_bookmarks_view(request: HttpRequest, template_name, context):
     if context["details"]:
         context["page_title"] = "Bookmark details - Linkding"
 
     if turbo.is_frame(request, "details-modal"):
-        return render(
+        return _render(
             request,
             "bookmarks/updates/details-modal-frame.html",
             context,
         )
 
-    return render(
+    return _render(
         request,
         template_name,
         context,
     )
 
 
+_BUNDLE_ENSURE_PARAMS = ('sort', 'shared', 'unread', 'date_filter_by', 'date_filter_type', 'date_filter_relative_string')
+# 一次取出所有需要补全的参数值，返回与_BUNDLE_ENSURE_PARAMS顺序一致的元组
+_bundle_ensure_getter = operator.attrgetter(*_BUNDLE_ENSURE_PARAMS)
+
+
 def _get_create_bundle_query_string(search: BookmarkSearch) -> str:
     """
     Generates a URL query string for the 'create bundle' link.
     This includes both explicit query parameters and default preferences.
     """
     params = search.query_params.copy()
-    ensure_params = ['sort', 'shared', 'unread', 'date_filter_by', 'date_filter_type', 'date_filter_relative_string']
-    
-    for param in ensure_params:
-        if param not in params:
-            value = getattr(search, param)
-            if value is not None and value != '':
-                params[param] = value
-                
+
+    for param, value in zip(_BUNDLE_ENSURE_PARAMS, _bundle_ensure_getter(search)):
+        if param not in params and value is not None and value != '':
+            params[param] = value
+
     if search.date_filter_type == 'absolute':
         if 'date_filter_start' not in params and search.date_filter_start:
             params['date_filter_start'] = search.date_filter_start.isoformat()
         if 'date_filter_end' not in params and search.date_filter_end:
             params['date_filter_end'] = search.date_filter_end.isoformat()
-            
-    return urllib.parse.urlencode(params)
+
+    return utils.urlencode_params(params)
 
 
 def search_action(request: HttpRequest):
-    if "save" in request.POST:
+    post = request.POST
+    search = None
+    if "save" in post:
         if not request.user.is_authenticated:
             return HttpResponseForbidden()
-        search = BookmarkSearch.from_request(request, request.POST)
+        saved_search = BookmarkSearch.from_request(request, post)
         
         # 根据当前页面路径决定保存到哪个偏好设置字段
         if request.path.endswith('/trash') or request.path.endswith('/trash/'):
             # 回收站页面，保存到trash_search_preferences
-            request.user_profile.trash_search_preferences = search.preferences_dict
+            request.user_profile.trash_search_preferences = saved_search.preferences_dict
         else:
             # 其他页面，保存到search_preferences
-            request.user_profile.search_preferences = search.preferences_dict
+            request.user_profile.search_preferences = saved_search.preferences_dict
         
         request.user_profile.save()
 
+        # 有Bundle时搜索不受偏好设置影响，可以直接复用，省去再次查询Bundle
+        if saved_search.bundle:
+            search = saved_search
+
     # Handle random sort request
-    if "sort" in request.POST and request.POST["sort"] == "randomxxx":
-        new_seed = int(time.time())
-        request.session['random_sort_seed'] = new_seed
+    # 只有明确点击“重新随机”时才生成新的种子，避免每次提交都写入session
+    if post.get("sort") == BookmarkSearch.SORT_RANDOM and post.get("reshuffle") == "1":
+        request.session["random_sort_seed"] = int(time.time())
 
     # redirect to base url including new query params
-    search = BookmarkSearch.from_request(
-        request, request.POST, request.user_profile.search_preferences
-    )
+    if search is None:
+        search = BookmarkSearch.from_request(
+            request, post, request.user_profile.search_preferences
+        )
     base_url = request.path
     query_params = search.query_params
-    query_string = urllib.parse.urlencode(query_params)
+    query_string = utils.urlencode_params(query_params)
     url = base_url if not query_string else base_url + "?" + query_string
     return HttpResponseRedirect(url)
 
@@ -258,22 +316,23 @@ def new(request: HttpRequest):
         if form.is_valid():
             form.save()
             if form.is_auto_close:
-                return HttpResponseRedirect(reverse("linkding:bookmarks.close"))
+                return HttpResponseRedirect(_reverse("linkding:bookmarks.close"))
             else:
-                return HttpResponseRedirect(reverse("linkding:bookmarks.index"))
+                return HttpResponseRedirect(_reverse("linkding:bookmarks.index"))
 
     status = 422 if request.method == "POST" and not form.is_valid() else 200
-    context = {"form": form, "return_url": reverse("linkding:bookmarks.index")}
+    context = {"form": form, "return_url": _reverse("linkding:bookmarks.index")}
 
-    return render(request, "bookmarks/new.html", context, status=status)
+    return _render(request, "bookmarks/new.html", context, status=status)
 
 
 @login_required
 def edit(request: HttpRequest, bookmark_id: int):
-    bookmark = access.bookmark_write(request, bookmark_id)
+    # 保存时校验重复URL需要访问owner
+    bookmark = access.bookmark_write(request, bookmark_id, select_related=("owner",))
     form = BookmarkForm(request, instance=bookmark)
     return_url = get_safe_return_url(
-        request.GET.get("return_url"), reverse("linkding:bookmarks.index")
+        request.GET.get("return_url"), _reverse("linkding:bookmarks.index")
     )
 
     if request.method == "POST":
@@ -284,7 +343,7 @@ def edit(request: HttpRequest, bookmark_id: int):
     status = 422 if request.method == "POST" and not form.is_valid() else 200
     context = {"form": form, "bookmark_id": bookmark_id, "return_url": return_url, "preview_image_file": bookmark.preview_image_file}
 
-    return render(request, "bookmarks/edit.html", context, status=status)
+    return _render(request, "bookmarks/edit.html", context, status=status)
 
 
 def remove(request: HttpRequest, bookmark_id: int | str):
@@ -312,13 +371,13 @@ def unarchive(request: HttpRequest, bookmark_id: int | str):
 def unshare(request: HttpRequest, bookmark_id: int | str):
     bookmark = access.bookmark_write(request, bookmark_id)
     bookmark.shared = False
-    bookmark.save()
+    bookmark.save(update_fields=["shared"])
 
 
 def mark_as_read(request: HttpRequest, bookmark_id: int | str):
     bookmark = access.bookmark_write(request, bookmark_id)
     bookmark.unread = False
-    bookmark.save()
+    bookmark.save(update_fields=["unread"])
 
 
 def prefetch_favicon(request: HttpRequest):
@@ -329,7 +388,7 @@ def prefetch_favicon(request: HttpRequest):
     if not url:
         return JsonResponse({"error": "URL parameter is missing"}, status=400)
 
-    favicon_file = favicon_loader.load_favicon(url, timeout=5)
+    favicon_file = favicon_loader.load_favicon_cached(url, timeout=5)
 
     if favicon_file:
         return JsonResponse({"status": "success", "favicon_file": favicon_file})
@@ -344,16 +403,13 @@ def load_temporary_preview_image(request: HttpRequest):
     if not image_url:
         return HttpResponseBadRequest({'error': 'URL parameter is missing'})
     try:
+        # 临时文件由定期任务按修改时间统一清理
         image_name = preview_image_loader.load_temporary_preview_image(image_url)
-        image_path = preview_image_loader._get_temporary_image_path(image_name)
-        tasks.delete_preview_image_temp_file.schedule(args=(image_path,), delay=600)
 
         temp_path = settings.STATIC_URL + "tmp" + "/" + image_name
         result = {
             "temp_path": temp_path
         }
-        print(result)
-        print(JsonResponse(result))
         return JsonResponse(result)
     except Exception as e:
         return HttpResponseBadRequest({'error': f'Failed to download image: {e}'})
@@ -388,18 +444,22 @@ def rename_asset(request: HttpRequest, asset_id: int | str):
 
 def update_state(request: HttpRequest, bookmark_id: int | str):
     bookmark = access.bookmark_write(request, bookmark_id)
-    bookmark.is_archived = request.POST.get("is_archived") == "on"
-    bookmark.unread = request.POST.get("unread") == "on"
-    bookmark.shared = request.POST.get("shared") == "on"
-    bookmark.save()
+    post = request.POST
+    bookmark.is_archived = post.get("is_archived") == "on"
+    bookmark.unread = post.get("unread") == "on"
+    bookmark.shared = post.get("shared") == "on"
+    bookmark.save(update_fields=["is_archived", "unread", "shared"])
 
 
 @login_required
 def index_action(request: HttpRequest):
-    search = BookmarkSearch.from_request(
-        request, request.GET, request.user_profile.search_preferences
-    )
-    query = queries.query_bookmarks(request.user, request.user_profile, search)
+    # 只有批量操作需要搜索条件和查询
+    query = None
+    if "bulk_execute" in request.POST:
+        search = BookmarkSearch.from_request(
+            request, request.GET, request.user_profile.search_preferences
+        )
+        query = queries.query_bookmarks(request.user, request.user_profile, search)
 
     response = handle_action(request, query)
     if response:
@@ -408,15 +468,20 @@ def index_action(request: HttpRequest):
     if turbo.accept(request):
         return partials.active_bookmark_update(request)
 
-    return utils.redirect_with_query(request, reverse("linkding:bookmarks.index"))
+    return utils.redirect_with_query(request, _reverse("linkding:bookmarks.index"))
 
 
 @login_required
 def archived_action(request: HttpRequest):
-    search = BookmarkSearch.from_request(
-        request, request.GET, request.user_profile.search_preferences
-    )
-    query = queries.query_archived_bookmarks(request.user, request.user_profile, search)
+    # 只有批量操作需要搜索条件和查询
+    query = None
+    if "bulk_execute" in request.POST:
+        search = BookmarkSearch.from_request(
+            request, request.GET, request.user_profile.search_preferences
+        )
+        query = queries.query_archived_bookmarks(
+            request.user, request.user_profile, search
+        )
 
     response = handle_action(request, query)
     if response:
@@ -425,7 +490,7 @@ def archived_action(request: HttpRequest):
     if turbo.accept(request):
         return partials.archived_bookmark_update(request)
 
-    return utils.redirect_with_query(request, reverse("linkding:bookmarks.archived"))
+    return utils.redirect_with_query(request, _reverse("linkding:bookmarks.archived"))
 
 
 @login_required
@@ -440,20 +505,22 @@ def shared_action(request: HttpRequest):
     if turbo.accept(request):
         return partials.shared_bookmark_update(request)
 
-    return utils.redirect_with_query(request, reverse("linkding:bookmarks.shared"))
+    return utils.redirect_with_query(request, _reverse("linkding:bookmarks.shared"))
 
 
 @login_required
 def trashed_action(request: HttpRequest):
-    # 如果用户的回收站搜索偏好为空，设置默认的删除时间降序
-    if not request.user_profile.trash_search_preferences:
-        request.user_profile.trash_search_preferences = {"sort": BookmarkSearch.SORT_DELETED_DESC}
-        request.user_profile.save()
+    _ensure_trash_search_preferences(request)
 
-    search = BookmarkSearch.from_request(
-        request, request.GET, request.user_profile.trash_search_preferences
-    )
-    query = queries.query_trashed_bookmarks(request.user, request.user_profile, search)
+    # 只有批量操作需要搜索条件和查询
+    query = None
+    if "bulk_execute" in request.POST:
+        search = BookmarkSearch.from_request(
+            request, request.GET, request.user_profile.trash_search_preferences
+        )
+        query = queries.query_trashed_bookmarks(
+            request.user, request.user_profile, search
+        )
 
     response = handle_action(request, query)
     if response:
@@ -462,99 +529,133 @@ def trashed_action(request: HttpRequest):
     if turbo.accept(request):
         return partials.trashed_bookmark_update(request)
 
-    return utils.redirect_with_query(request, reverse("linkding:bookmarks.trashed"))
+    return utils.redirect_with_query(request, _reverse("linkding:bookmarks.trashed"))
 
 
-def handle_action(request: HttpRequest, query: QuerySet[Bookmark] = None):
-    # Single bookmark actions
-    if "archive" in request.POST:
-        return archive(request, request.POST["archive"])
-    if "unarchive" in request.POST:
-        return unarchive(request, request.POST["unarchive"])
-    if "remove" in request.POST:
-        return remove(request, request.POST["remove"])
-    if "mark_as_read" in request.POST:
-        return mark_as_read(request, request.POST["mark_as_read"])
-    if "unshare" in request.POST:
-        return unshare(request, request.POST["unshare"])
-    if "create_html_snapshot" in request.POST:
-        return create_html_snapshot(request, request.POST["create_html_snapshot"])
-    if "upload_asset" in request.POST:
-        return upload_asset(request, request.POST["upload_asset"])
-    if "remove_asset" in request.POST:
-        return remove_asset(request, request.POST["remove_asset"])
-    if "rename_asset" in request.POST:
-        return rename_asset(request, request.POST["rename_asset"])
-    if "trash" in request.POST:
-        return trash(request, request.POST["trash"])
-    if "restore" in request.POST:
-        return restore(request, request.POST["restore"])
+BULK_ID_FETCH_CHUNK_SIZE = 2000
+BULK_ACTION_CHUNK_SIZE = 1000
 
+
+def _run_bulk_action(action, bookmark_ids: list, *args, **kwargs):
+    # 分批执行批量操作，每批对应一条 WHERE id IN (...) 语句，
+    # 同时避免超出 SQLite 单条语句的参数数量限制。
+    # 所有批次在同一事务中执行，失败时不会只更新部分书签
+    with transaction.atomic():
+        for start in range(0, len(bookmark_ids), BULK_ACTION_CHUNK_SIZE):
+            action(bookmark_ids[start : start + BULK_ACTION_CHUNK_SIZE], *args, **kwargs)
+
+
+# Single bookmark actions, checked in this order
+_SINGLE_ACTIONS = {
+    "archive": archive,
+    "unarchive": unarchive,
+    "remove": remove,
+    "mark_as_read": mark_as_read,
+    "unshare": unshare,
+    "create_html_snapshot": create_html_snapshot,
+    "upload_asset": upload_asset,
+    "remove_asset": remove_asset,
+    "rename_asset": rename_asset,
+    "trash": trash,
+    "restore": restore,
     # State updates
-    if "update_state" in request.POST:
-        return update_state(request, request.POST["update_state"])
+    "update_state": update_state,
+}
+
+# 批量操作 -> (服务函数, 是否需要标签字符串, 是否写入时间戳)
+_BULK_ACTIONS = {
+    "bulk_archive": (archive_bookmarks, False, True),
+    "bulk_unarchive": (unarchive_bookmarks, False, True),
+    "bulk_delete": (delete_bookmarks, False, False),
+    "bulk_tag": (tag_bookmarks, True, True),
+    "bulk_untag": (untag_bookmarks, True, True),
+    "bulk_read": (mark_bookmarks_as_read, False, True),
+    "bulk_unread": (mark_bookmarks_as_unread, False, True),
+    "bulk_share": (share_bookmarks, False, True),
+    "bulk_unshare": (unshare_bookmarks, False, True),
+    "bulk_refresh": (refresh_bookmarks_metadata, False, False),
+    "bulk_trash": (trash_bookmarks, False, True),
+    "bulk_restore": (restore_bookmarks, False, False),
+    "bulk_snapshot": (create_html_snapshots, False, False),
+    "bulk_remove_snapshot": (remove_all_html_snapshots, False, False),
+}
+
+
+def handle_action(request: HttpRequest, query: QuerySet[Bookmark] = None):
+    post = request.POST
+
+    for key, action in _SINGLE_ACTIONS.items():
+        if key in post:
+            return action(request, post[key])
 
     # Bulk actions
-    if "bulk_execute" in request.POST:
+    if "bulk_execute" in post:
         if query is None:
             raise ValueError("Query must be provided for bulk actions")
 
-        bulk_action = request.POST["bulk_action"]
+        bulk_action = _BULK_ACTIONS.get(post["bulk_action"])
+        if bulk_action is None:
+            return None
+        action, needs_tag_string, sets_timestamp = bulk_action
 
         # Determine set of bookmarks
-        if request.POST.get("bulk_select_across") == "on":
+        if post.get("bulk_select_across") == "on":
             # Query full list of bookmarks across all pages
-            bookmark_ids = query.only("id").values_list("id", flat=True)
+            # 一次性取出全部 ID，避免把惰性 QuerySet 传给服务层后被重复求值
+            # 批量操作与顺序无关，清除排序，避免数据库对全部结果排序
+            bookmark_ids = list(
+                query.order_by()
+                .only("id")
+                .values_list("id", flat=True)
+                .iterator(chunk_size=BULK_ID_FETCH_CHUNK_SIZE)
+            )
         else:
             # Use only selected bookmarks
-            bookmark_ids = request.POST.getlist("bookmark_id")
-
-        if "bulk_archive" == bulk_action:
-            return archive_bookmarks(bookmark_ids, request.user)
-        if "bulk_unarchive" == bulk_action:
-            return unarchive_bookmarks(bookmark_ids, request.user)
-        if "bulk_delete" == bulk_action:
-            return delete_bookmarks(bookmark_ids, request.user)
-        if "bulk_tag" == bulk_action:
-            tag_string = convert_tag_string(request.POST["bulk_tag_string"])
-            return tag_bookmarks(bookmark_ids, tag_string, request.user)
-        if "bulk_untag" == bulk_action:
-            tag_string = convert_tag_string(request.POST["bulk_tag_string"])
-            return untag_bookmarks(bookmark_ids, tag_string, request.user)
-        if "bulk_read" == bulk_action:
-            return mark_bookmarks_as_read(bookmark_ids, request.user)
-        if "bulk_unread" == bulk_action:
-            return mark_bookmarks_as_unread(bookmark_ids, request.user)
-        if "bulk_share" == bulk_action:
-            return share_bookmarks(bookmark_ids, request.user)
-        if "bulk_unshare" == bulk_action:
-            return unshare_bookmarks(bookmark_ids, request.user)
-        if "bulk_refresh" == bulk_action:
-            return refresh_bookmarks_metadata(bookmark_ids, request.user)
-        if "bulk_trash" == bulk_action:
-            return trash_bookmarks(bookmark_ids, request.user)
-        if "bulk_restore" == bulk_action:
-            return restore_bookmarks(bookmark_ids, request.user)
-        if "bulk_snapshot" == bulk_action:
-            return create_html_snapshots(bookmark_ids, request.user)
-        if "bulk_remove_snapshot" == bulk_action:
-            return remove_all_html_snapshots(bookmark_ids, request.user)
+            bookmark_ids = post.getlist("bookmark_id")
+
+        # 所有批次使用同一个时间戳
+        kwargs = {"now": timezone.now()} if sets_timestamp else {}
+        if needs_tag_string:
+            tag_string = convert_tag_string(post["bulk_tag_string"])
+            return _run_bulk_action(
+                action, bookmark_ids, tag_string, request.user, **kwargs
+            )
+        return _run_bulk_action(action, bookmark_ids, request.user, **kwargs)
 
 
 @login_required
 def close(request: HttpRequest):
-    return render(request, "bookmarks/close.html")
+    return _render(request, "bookmarks/close.html")
+
+
+# 后台加载阅读模式内容时的轮询次数，超过后在当前请求中直接加载
+READER_MAX_POLL_ATTEMPTS = 20
 
 
 @login_required
 def read(request: HttpRequest, bookmark_id: int):
     bookmark = access.bookmark_read(request, bookmark_id)
-    try:
-        content = website_loader.load_full_page(bookmark.url)
-    except Exception as e:
-        content = f"<html><body><p>无法加载页面内容：{str(e)}</p></body></html>"
-    
-    return render(
+    content = reader.get_cached_content(bookmark)
+
+    if content is None:
+        try:
+            attempt = int(request.GET.get("attempt", 0))
+        except ValueError:
+            attempt = 0
+
+        if settings.LD_DISABLE_BACKGROUND_TASKS or attempt >= READER_MAX_POLL_ATTEMPTS:
+            content = reader.load_content(bookmark)
+        else:
+            # 页面由后台任务加载，先返回加载页并轮询，避免请求线程阻塞在外部请求上
+            if attempt == 0:
+                tasks.load_reader_content(bookmark)
+            return _render(
+                request,
+                "bookmarks/read_loading.html",
+                {"reload_url": f"{request.path}?attempt={attempt + 1}"},
+            )
+
+    return _render(
         request,
         "bookmarks/read.html",
         {
@@ -1,3 +1,4 @@
+import datetime
 import re
 import urllib.parse
 from typing import Set, List
@@ -7,6 +8,7 @@ from django.core.paginator import Paginator
 from django.db import models
 from django.http import Http404
 from django.urls import reverse
+from django.utils import timezone
 
 from bookmarks import queries
 from bookmarks import utils
@@ -121,6 +123,7 @@ class BookmarkItem:
         bookmark: Bookmark,
         user: User,
         profile: UserProfile,
+        now: datetime.datetime = None,
     ) -> None:
         self.bookmark = bookmark
 
@@ -163,21 +166,14 @@ class BookmarkItem:
 
         self.css_classes = " ".join(css_classes)
 
-        if not bookmark.is_deleted:
-            if profile.bookmark_date_display == UserProfile.BOOKMARK_DATE_DISPLAY_RELATIVE:
-                self.display_date = utils.humanize_relative_date(bookmark.date_added)
-            elif (
-                profile.bookmark_date_display == UserProfile.BOOKMARK_DATE_DISPLAY_ABSOLUTE
-            ):
-                self.display_date = utils.humanize_absolute_date_short(bookmark.date_added)
-        else:
-            # 若书签已被删除，则显示删除日期
-            if profile.bookmark_date_display == UserProfile.BOOKMARK_DATE_DISPLAY_RELATIVE:
-                self.display_date = utils.humanize_relative_date(bookmark.date_deleted)
-            elif (
-                profile.bookmark_date_display == UserProfile.BOOKMARK_DATE_DISPLAY_ABSOLUTE
-            ):
-                self.display_date = utils.humanize_absolute_date_short(bookmark.date_deleted)
+        # 若书签已被删除，则显示删除日期
+        display_date = bookmark.date_deleted if bookmark.is_deleted else bookmark.date_added
+        if profile.bookmark_date_display == UserProfile.BOOKMARK_DATE_DISPLAY_RELATIVE:
+            self.display_date = utils.humanize_relative_date(display_date, now)
+        elif (
+            profile.bookmark_date_display == UserProfile.BOOKMARK_DATE_DISPLAY_ABSOLUTE
+        ):
+            self.display_date = utils.humanize_absolute_date_short(display_date, now)
 
         self.show_notes_button = bookmark.notes and not profile.permanent_notes
         self.show_mark_as_read = is_editable and bookmark.unread
@@ -199,15 +195,24 @@ class BookmarkListContext:
         self.request = request
         self.search = search
 
-        query_set = request_context.get_bookmark_query_set(self.search)
+        # Load owners in the same query as the bookmarks
+        query_set = request_context.get_bookmark_query_set(self.search).select_related(
+            "owner"
+        )
         page_number = request.GET.get("page")
         paginator = Paginator(query_set, user_profile.items_per_page)
         bookmarks_page = paginator.get_page(page_number)
-        # Prefetch related objects, this avoids n+1 queries when accessing fields in templates
-        models.prefetch_related_objects(bookmarks_page.object_list, "owner", "tags")
+        # Prefetch tags, this avoids n+1 queries when accessing fields in templates.
+        # The list only renders tag names, so don't load the other columns
+        models.prefetch_related_objects(
+            bookmarks_page.object_list,
+            models.Prefetch("tags", queryset=Tag.objects.only("id", "name")),
+        )
 
+        # Use the same reference time for all items on the page
+        now = timezone.now()
         self.items = [
-            BookmarkItem(request_context, bookmark, user, user_profile)
+            BookmarkItem(request_context, bookmark, user, user_profile, now)
             for bookmark in bookmarks_page
         ]
         self.is_empty = paginator.count == 0
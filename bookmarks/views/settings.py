@@ -44,7 +44,9 @@ def general(request: HttpRequest, status=200, context_overrides=None):
     profile_form = UserProfileForm(instance=request.user_profile)
     global_settings_form = None
     if request.user.is_superuser:
-        global_settings_form = GlobalSettingsForm(instance=GlobalSettings.get())
+        global_settings_form = GlobalSettingsForm(
+            instance=_get_global_settings(request)
+        )
 
     if context_overrides is None:
         context_overrides = {}
@@ -125,11 +127,22 @@ def update_profile(request: HttpRequest):
     return general(request, 422, {"form": form})
 
 
+def _get_global_settings(request):
+    # LinkdingMiddleware already loaded the settings for this request, only
+    # query them again if it had to fall back to unsaved default settings
+    global_settings = getattr(request, "global_settings", None)
+    if global_settings is None or global_settings.pk is None:
+        global_settings = GlobalSettings.get()
+    return global_settings
+
+
 def update_global_settings(request):
     user = request.user
     if not user.is_superuser:
         raise PermissionDenied()
 
+    # bind a fresh instance, an invalid form must not modify the settings
+    # shared by the rest of the request
     form = GlobalSettingsForm(request.POST, instance=GlobalSettings.get())
     if form.is_valid():
         form.save()